@@ -0,0 +1,33 @@
+"""add_recipe_category_cuisine_index
+
+Revision ID: c3f1a9d27b54
+Revises: 4108b340e611
+Create Date: 2026-10-16 09:12:44.518302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f1a9d27b54"
+down_revision: Union[str, Sequence[str], None] = "4108b340e611"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_recipes_category_cuisine",
+        "recipes",
+        ["category", "cuisine"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_recipes_category_cuisine", table_name="recipes")
@@ -172,9 +172,11 @@ def read_recipe(
         response["unit_system"] = units.value
     else:
         # Derive unit system from original ingredients
-        all_ingredients = []
-        for component in response.get("components", []):
-            all_ingredients.extend(component.get("ingredients", []))
+        all_ingredients = (
+            ingredient
+            for component in response.get("components", [])
+            for ingredient in component.get("ingredients", [])
+        )
         response["unit_system"] = detect_recipe_unit_system(all_ingredients).value
 
     return response
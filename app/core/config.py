@@ -26,6 +26,15 @@ class Settings(BaseSettings):
     SECRET_KEY: str  # Required - must be set via environment variable
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     ALGORITHM: str = "HS256"
+    # bcrypt work factor for password hashes (cost grows as 2^rounds)
+    BCRYPT_ROUNDS: int = 12
+
+    @field_validator("BCRYPT_ROUNDS")
+    @classmethod
+    def validate_bcrypt_rounds(cls, v: int) -> int:
+        if not 4 <= v <= 31:
+            raise ValueError("BCRYPT_ROUNDS must be between 4 and 31")
+        return v
 
     @field_validator("SECRET_KEY")
     @classmethod
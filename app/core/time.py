@@ -0,0 +1,9 @@
+from datetime import datetime, timezone
+
+
+def now() -> datetime:
+    """
+    Current UTC time used for recipe audit timestamps.
+    Kept behind a function so tests can pin the clock instead of sleeping.
+    """
+    return datetime.now(timezone.utc)
@@ -3,7 +3,6 @@
 
 import logging
 from sqlalchemy.orm import Session, joinedload, selectinload
-from datetime import datetime, timezone
 from pwdlib import PasswordHash
 from pwdlib.hashers.bcrypt import BcryptHasher
 from uuid import UUID
@@ -11,10 +10,12 @@ from uuid import UUID
 from app import schemas
 from app import filters
 from app import models
+from app.core.config import settings
 from app.core.hashing import calculate_recipe_checksum
+from app.core import time as app_time
 
 
-password_hash = PasswordHash((BcryptHasher(),))
+password_hash = PasswordHash((BcryptHasher(rounds=settings.BCRYPT_ROUNDS),))
 
 
 # Get a logger instance
@@ -29,28 +30,30 @@ def check_cycle(db: Session, child_id: UUID, parent_id: UUID):
     if child_id == parent_id:
         raise ValueError("A recipe cannot be its own parent")
 
-    current_id = parent_id
-    while current_id:
-        # Fetch parent
-        # Optimization: We only need the parent_recipe_id of the current node
-        parent_node = (
-            db.query(models.Recipe.parent_recipe_id)
-            .filter(models.Recipe.id == current_id)
-            .first()
+    # Recursive CTE: parent_id's row, then the row of each ancestor above it,
+    # up to the root. UNION (not UNION ALL) stops the recursion if the stored
+    # data already contains a loop.
+    ancestors = (
+        db.query(models.Recipe.id, models.Recipe.parent_recipe_id)
+        .filter(models.Recipe.id == parent_id)
+        .cte("ancestors", recursive=True)
+    )
+    ancestors = ancestors.union(
+        db.query(models.Recipe.id, models.Recipe.parent_recipe_id).join(
+            ancestors, models.Recipe.id == ancestors.c.parent_recipe_id
         )
-        if not parent_node:
-            break  # Parent not found? connection broken or root reached if we consider query failure (unlikely for valid IDs)
-
-        # parent_node is a named tuple or result row? .parent_recipe_id accessed directly?
-        # query(Column) returns a Row. row[0] or row.parent_recipe_id
-        pid = parent_node[0]
-
-        if pid == child_id:
-            raise ValueError(
-                "Cycle detected: This would make a recipe a descendant of its own child"
-            )
+    )
 
-        current_id = pid
+    # child_id being the parent of any ancestor means child_id is above parent_id
+    cycle = (
+        db.query(ancestors.c.id)
+        .filter(ancestors.c.parent_recipe_id == child_id)
+        .first()
+    )
+    if cycle:
+        raise ValueError(
+            "Cycle detected: This would make a recipe a descendant of its own child"
+        )
 
 
 def verify_password(plain_password, hashed_password):
@@ -235,8 +238,23 @@ def get_recipes(
     # Apply sorting
     query = filters.apply_sorting(query, sort_by)
 
-    # Apply pagination
-    recipes = query.offset(skip).limit(limit).all()
+    # Apply pagination, eager loading everything the list response serializes.
+    # selectinload keeps it to one extra query per relationship for the whole
+    # page (instead of one per recipe) and is safe alongside LIMIT and the
+    # joins added by filters.
+    recipes = (
+        query.options(
+            selectinload(models.Recipe.components)
+            .selectinload(models.RecipeComponent.ingredients)
+            .selectinload(models.RecipeIngredient.ingredient),
+            selectinload(models.Recipe.instructions),
+            selectinload(models.Recipe.diets),
+            selectinload(models.Recipe.variants),
+        )
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
     return recipes, total_count
 
@@ -309,6 +327,33 @@ def create_user_recipe(
     Create a new recipe and its associated ingredients, instructions.
     """
     logger.debug(f"Creating recipe: {recipe}")
+    db_recipe = _add_user_recipe(db, recipe, user_id)
+
+    # Single commit for the entire transaction
+    db.commit()
+    db.refresh(db_recipe)
+    return db_recipe
+
+
+def create_user_recipes_bulk(
+    db: Session, recipes: list[schemas.RecipeCreate], user_id: UUID
+):
+    """
+    Create several recipes for one user in a single transaction.
+    Returned recipes are expired by the commit and reload lazily on access.
+    """
+    logger.debug(f"Creating {len(recipes)} recipes for user {user_id}")
+    db_recipes = [_add_user_recipe(db, recipe, user_id) for recipe in recipes]
+
+    db.commit()
+    return db_recipes
+
+
+def _add_user_recipe(db: Session, recipe: schemas.RecipeCreate, user_id: UUID):
+    """
+    Add a recipe and its components, ingredients, instructions and diets to the
+    session without committing.
+    """
 
     # Extract data from nested schema groups
     core_data = recipe.core.model_dump()
@@ -327,9 +372,9 @@ def create_user_recipe(
 
     # Explicit timestamp logic
     if "created_at" not in audit_data:
-        audit_data["created_at"] = datetime.now(timezone.utc)
+        audit_data["created_at"] = app_time.now()
     if "updated_at" not in audit_data:
-        audit_data["updated_at"] = datetime.now(timezone.utc)
+        audit_data["updated_at"] = app_time.now()
 
     # Calculate Checksum
     checksum = calculate_recipe_checksum(recipe.model_dump(exclude={"audit"}))
@@ -390,9 +435,6 @@ def create_user_recipe(
         recipe_diet = models.RecipeDiet(recipe_id=db_recipe.id, diet_type=diet)
         db.add(recipe_diet)
 
-    # Single commit for the entire transaction
-    db.commit()
-    db.refresh(db_recipe)
     return db_recipe
 
 
@@ -417,7 +459,7 @@ def update_recipe(db: Session, recipe_id: UUID, recipe_update: schemas.RecipeCre
         else {}
     )
     if "updated_at" not in audit_data:
-        audit_data["updated_at"] = datetime.now(timezone.utc)
+        audit_data["updated_at"] = app_time.now()
 
     update_data = {**core_data, **times_data, **nutrition_data, **audit_data}
 
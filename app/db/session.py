@@ -2,11 +2,34 @@
 # Configures the database connection and session management using SQLAlchemy.
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+
+def _is_in_memory_sqlite(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and (
+        url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+    )
+
+
+# An in-memory SQLite database exists only as long as its connection, so every
+# session shares one connection; file databases keep the default pool.
+_pool_args = (
+    {"poolclass": StaticPool} if _is_in_memory_sqlite(settings.DATABASE_URL) else {}
+)
+
+# A larger compiled-statement cache than the default (500) so the many filter,
+# sort and eager-load combinations of the list endpoints stay cached.
+engine = create_engine(
+    settings.DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    query_cache_size=1200,
+    **_pool_args,
+)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
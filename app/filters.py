@@ -1,5 +1,6 @@
 # app/filters.py
-from typing import List, Any
+from typing import List, Any, NamedTuple
+import operator
 from sqlalchemy.orm import Query
 from sqlalchemy import asc, desc, or_, case
 from uuid import UUID
@@ -8,11 +9,10 @@ import re
 from app import models
 
 
-class Filter:
-    def __init__(self, field: str, operator: str, value: Any):
-        self.field = field
-        self.operator = operator
-        self.value = value
+class Filter(NamedTuple):
+    field: str
+    operator: str
+    value: Any
 
     def __repr__(self):
         return f"Filter({self.field} {self.operator} {self.value})"
@@ -37,6 +37,22 @@ ALLOWED_FIELDS = {
     # 'suitable_for_diet': 'suitable_for_diet' # Also special
 }
 
+# Comparison operators shared by the general field handling of every
+# apply_*_filters function. Filters always resolve to the mapped Column objects
+# above, so the same filter shape produces the same statement and hits
+# SQLAlchemy's compiled cache.
+OPERATORS = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": lambda col, value: col.in_(value.split(",")),
+    # Case insensitive default for 'like'
+    "like": lambda col, value: col.ilike(f"%{value}%"),
+}
+
 SORT_FIELDS = {
     "created_at": models.Recipe.created_at,
     "updated_at": models.Recipe.updated_at,
@@ -105,19 +121,20 @@ ALLOWED_FIELDS_MEAL_TEMPLATE = {
 }
 
 
+# Pattern to match field[operator]=value
+FILTER_KEY_PATTERN = re.compile(r"^(\w+)\[(\w+)\]$")
+
+
 def parse_filters(query_params: dict) -> List[Filter]:
     filters = []
-    # Pattern to match field[operator]=value
-    pattern = re.compile(r"^(\w+)\[(\w+)\]$")
-
     for key, value in query_params.items():
-        match = pattern.match(key)
+        match = FILTER_KEY_PATTERN.match(key)
         if match:
-            field, operator = match.groups()
+            field, op = match.groups()
 
             # Basic validation could happen here or during application
-            filters.append(Filter(field, operator, value))
-        elif key == "name" and "name[like]" not in query_params:
+            filters.append(Filter(field, op, value))
+        elif key == "name":
             # Support simple ?name=foo as alias for ?name[like]=foo logic if desired?
             # Or strict adherence to bracket syntax?
             # User requested LHS brackets pattern. Stick to that mostly, but raw name= search is common.
@@ -241,25 +258,9 @@ def apply_filters(query: Query, filters: List[Filter]) -> Query:
         if not model_attr:
             continue  # specific logging provided?
 
-        if f.operator == "eq":
-            query = query.filter(model_attr == f.value)
-        elif f.operator == "neq":
-            query = query.filter(model_attr != f.value)
-        elif f.operator == "gt":
-            query = query.filter(model_attr > f.value)
-        elif f.operator == "gte":
-            query = query.filter(model_attr >= f.value)
-        elif f.operator == "lt":
-            query = query.filter(model_attr < f.value)
-        elif f.operator == "lte":
-            query = query.filter(model_attr <= f.value)
-        elif f.operator == "in":
-            vals = f.value.split(",")
-            query = query.filter(model_attr.in_(vals))
-        elif f.operator == "like":
-            query = query.filter(
-                model_attr.ilike(f"%{f.value}%")
-            )  # Case insensitive default for 'like' in this context?
+        op = OPERATORS.get(f.operator)
+        if op is not None:
+            query = query.filter(op(model_attr, f.value))
 
     return query
 
@@ -339,23 +340,9 @@ def apply_meal_filters(query: Query, filters: List[Filter]) -> Query:
         if not model_attr:
             continue
 
-        if f.operator == "eq":
-            query = query.filter(model_attr == f.value)
-        elif f.operator == "neq":
-            query = query.filter(model_attr != f.value)
-        elif f.operator == "gt":
-            query = query.filter(model_attr > f.value)
-        elif f.operator == "gte":
-            query = query.filter(model_attr >= f.value)
-        elif f.operator == "lt":
-            query = query.filter(model_attr < f.value)
-        elif f.operator == "lte":
-            query = query.filter(model_attr <= f.value)
-        elif f.operator == "in":
-            vals = f.value.split(",")
-            query = query.filter(model_attr.in_(vals))
-        elif f.operator == "like":
-            query = query.filter(model_attr.ilike(f"%{f.value}%"))
+        op = OPERATORS.get(f.operator)
+        if op is not None:
+            query = query.filter(op(model_attr, f.value))
 
     return query
 
@@ -445,23 +432,9 @@ def apply_recipe_list_filters(query: Query, filters: List[Filter]) -> Query:
         if not model_attr:
             continue
 
-        if f.operator == "eq":
-            query = query.filter(model_attr == f.value)
-        elif f.operator == "neq":
-            query = query.filter(model_attr != f.value)
-        elif f.operator == "gt":
-            query = query.filter(model_attr > f.value)
-        elif f.operator == "gte":
-            query = query.filter(model_attr >= f.value)
-        elif f.operator == "lt":
-            query = query.filter(model_attr < f.value)
-        elif f.operator == "lte":
-            query = query.filter(model_attr <= f.value)
-        elif f.operator == "in":
-            vals = f.value.split(",")
-            query = query.filter(model_attr.in_(vals))
-        elif f.operator == "like":
-            query = query.filter(model_attr.ilike(f"%{f.value}%"))
+        op = OPERATORS.get(f.operator)
+        if op is not None:
+            query = query.filter(op(model_attr, f.value))
 
     return query
 
@@ -543,23 +516,9 @@ def apply_template_filters(query: Query, filters: List[Filter]) -> Query:
         if not model_attr:
             continue
 
-        if f.operator == "eq":
-            query = query.filter(model_attr == f.value)
-        elif f.operator == "neq":
-            query = query.filter(model_attr != f.value)
-        elif f.operator == "gt":
-            query = query.filter(model_attr > f.value)
-        elif f.operator == "gte":
-            query = query.filter(model_attr >= f.value)
-        elif f.operator == "lt":
-            query = query.filter(model_attr < f.value)
-        elif f.operator == "lte":
-            query = query.filter(model_attr <= f.value)
-        elif f.operator == "in":
-            vals = f.value.split(",")
-            query = query.filter(model_attr.in_(vals))
-        elif f.operator == "like":
-            query = query.filter(model_attr.ilike(f"%{f.value}%"))
+        op = OPERATORS.get(f.operator)
+        if op is not None:
+            query = query.filter(op(model_attr, f.value))
 
     # Apply all num_slots filters together with a single join/group_by
     if num_slots_filters:
@@ -599,22 +558,8 @@ def apply_meal_template_generate_filters(query: Query, filters: List[Filter]) ->
         if not model_attr:
             continue
 
-        if f.operator == "eq":
-            query = query.filter(model_attr == f.value)
-        elif f.operator == "neq":
-            query = query.filter(model_attr != f.value)
-        elif f.operator == "gt":
-            query = query.filter(model_attr > f.value)
-        elif f.operator == "gte":
-            query = query.filter(model_attr >= f.value)
-        elif f.operator == "lt":
-            query = query.filter(model_attr < f.value)
-        elif f.operator == "lte":
-            query = query.filter(model_attr <= f.value)
-        elif f.operator == "in":
-            vals = f.value.split(",")
-            query = query.filter(model_attr.in_(vals))
-        elif f.operator == "like":
-            query = query.filter(model_attr.ilike(f"%{f.value}%"))
+        op = OPERATORS.get(f.operator)
+        if op is not None:
+            query = query.filter(op(model_attr, f.value))
 
     return query
@@ -16,7 +16,7 @@ from sqlalchemy import (
     Float,
     JSON,
 )
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import Uuid
 from app.db.session import Base
@@ -86,6 +86,9 @@ class Recipe(Base):
     """
 
     __tablename__ = "recipes"
+    # name, category, cuisine and parent_recipe_id are indexed individually
+    # below; this covers the combined category + cuisine filter/sort.
+    __table_args__ = (Index("ix_recipes_category_cuisine", "category", "cuisine"),)
 
     id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
 
@@ -1,9 +1,11 @@
 # unit_conversion.py
 # Handles metric/imperial unit classification and conversion for recipe ingredients.
-# Uses the pint library for accurate unit conversions.
+# Conversion factors come from the pint library, computed once at import.
 
+import math
 from enum import Enum
-from typing import Optional, Tuple
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple, Optional, Tuple, TypeVar
 
 import pint
 
@@ -155,13 +157,30 @@ SIMPLIFICATION_THRESHOLDS = {
 }
 
 
+_V = TypeVar("_V")
+
+
+def _normalize_unit(unit: str) -> str:
+    """Case-fold and trim a user-entered unit string for alias lookups."""
+    return unit.casefold().strip()
+
+
+def _lookup_alias(table: Mapping[str, _V], unit: str) -> Optional[_V]:
+    """Look up a unit string in an alias-keyed table."""
+    # Aliases are stored already normalized and most stored units match one
+    # as-is, so only normalize after the direct probe misses.
+    value = table.get(unit)
+    if value is None:
+        value = table.get(_normalize_unit(unit))
+    return value
+
+
 def get_pint_unit(unit_str: str) -> Optional[str]:
     """
     Convert a unit string to its pint-compatible name.
     Returns None if unit is not recognized.
     """
-    normalized = unit_str.lower().strip()
-    return UNIT_ALIASES.get(normalized)
+    return _lookup_alias(UNIT_ALIASES, unit_str)
 
 
 def get_unit_system(pint_unit: str) -> Optional[UnitSystem]:
@@ -190,97 +209,124 @@ def get_unit_type(pint_unit: str) -> Optional[str]:
     return None
 
 
+def _build_unit_table() -> Mapping[str, Tuple[str, UnitSystem, str]]:
+    """Resolve every alias in UNIT_ALIASES to its (canonical, system, type) triple."""
+    # One triple per canonical unit, shared by all of its aliases, so lookups
+    # hand out existing tuples instead of building equal ones.
+    unit_info = {}
+    for pint_unit in set(UNIT_ALIASES.values()):
+        system = get_unit_system(pint_unit)
+        unit_type = get_unit_type(pint_unit)
+        if system is not None and unit_type is not None:
+            unit_info[pint_unit] = (pint_unit, system, unit_type)
+
+    return MappingProxyType(
+        {
+            alias: unit_info[pint_unit]
+            for alias, pint_unit in UNIT_ALIASES.items()
+            if pint_unit in unit_info
+        }
+    )
+
+
+# Every alias, keyed by its normalized spelling, resolved once at import.
+_UNIT_TABLE = _build_unit_table()
+
+
+# Per-alias vote used when detecting a recipe's predominant unit system.
+_UNIT_SYSTEM_SCORE = MappingProxyType(
+    {
+        alias: 1 if system == UnitSystem.IMPERIAL else -1
+        for alias, (_, system, _) in _UNIT_TABLE.items()
+    }
+)
+
+
+class _Conversion(NamedTuple):
+    """Precomputed conversion from one canonical unit into the other system."""
+
+    factor: float  # source unit -> preferred target unit
+    threshold: float  # converted value at which to switch to the larger unit
+    # Indexed by ``converted_value >= threshold``: [preferred, larger].
+    scales: Tuple[float, float]  # 1.0, then preferred -> larger unit factor
+    units: Tuple[str, str]  # display names of the preferred and larger units
+
+
+def _build_conversions() -> Mapping[str, _Conversion]:
+    """Map each canonical unit to its pint-derived conversion into the other system."""
+    conversions = {}
+    for pint_unit, system, unit_type in set(_UNIT_TABLE.values()):
+        # With two systems, a unit only ever converts into the other one.
+        (target_system,) = (s for s in UnitSystem if s != system)
+        target_unit = PREFERRED_UNITS[target_system][unit_type]
+        factor = (1 * getattr(ureg, pint_unit)).to(getattr(ureg, target_unit))
+        threshold, larger_unit = SIMPLIFICATION_THRESHOLDS.get(
+            target_unit, (math.inf, target_unit)
+        )
+        larger_factor = (1 * getattr(ureg, target_unit)).to(getattr(ureg, larger_unit))
+        conversions[pint_unit] = _Conversion(
+            factor=factor.magnitude,
+            threshold=threshold,
+            scales=(1.0, larger_factor.magnitude),
+            units=(
+                DISPLAY_NAMES.get(target_unit, target_unit),
+                DISPLAY_NAMES.get(larger_unit, larger_unit),
+            ),
+        )
+    return MappingProxyType(conversions)
+
+
+# Keyed by canonical source unit; the target is always the other system.
+_CONVERSIONS = _build_conversions()
+
+
 def get_unit_info(unit: str) -> Optional[Tuple[str, UnitSystem, str]]:
     """
     Get canonical name, unit system, and type for a unit.
     Returns None if unit is not recognized.
     """
-    pint_unit = get_pint_unit(unit)
-    if pint_unit is None:
-        return None
-
-    system = get_unit_system(pint_unit)
-    unit_type = get_unit_type(pint_unit)
+    return _lookup_alias(_UNIT_TABLE, unit)
 
-    if system is None or unit_type is None:
-        return None
 
-    return (pint_unit, system, unit_type)
-
-
-def detect_recipe_unit_system(ingredients: list) -> UnitSystem:
+def detect_recipe_unit_system(ingredients: Iterable[dict]) -> UnitSystem:
     """
     Determine the predominant unit system used in a recipe's ingredients.
     Returns METRIC if majority of recognized units are metric,
     IMPERIAL if majority are imperial, or IMPERIAL as default.
     """
-    metric_count = 0
-    imperial_count = 0
-
-    for ingredient in ingredients:
-        unit = ingredient.get("unit", "")
-        pint_unit = get_pint_unit(unit)
-        if pint_unit:
-            system = get_unit_system(pint_unit)
-            if system == UnitSystem.METRIC:
-                metric_count += 1
-            elif system == UnitSystem.IMPERIAL:
-                imperial_count += 1
-
-    if metric_count > imperial_count:
-        return UnitSystem.METRIC
-    elif imperial_count > metric_count:
-        return UnitSystem.IMPERIAL
-    else:
-        return UnitSystem.IMPERIAL
+    # Imperial units vote +1 and metric -1, so only a metric majority goes negative.
+    score = sum(
+        _lookup_alias(_UNIT_SYSTEM_SCORE, ingredient.get("unit", "")) or 0
+        for ingredient in ingredients
+    )
+    return UnitSystem.METRIC if score < 0 else UnitSystem.IMPERIAL
+
+
+def _convert_known_unit(quantity: float, pint_unit: str) -> Tuple[float, str]:
+    """Convert a quantity of a recognized unit into the other system."""
+    conversion = _CONVERSIONS[pint_unit]
+    converted_value = quantity * conversion.factor
+
+    # Simplify large quantities by indexing with the comparison, not branching.
+    larger = converted_value >= conversion.threshold
+    return (
+        round(converted_value * conversion.scales[larger], 2),
+        conversion.units[larger],
+    )
 
 
 def convert_quantity(
     quantity: float, from_unit: str, target_system: UnitSystem
 ) -> Tuple[float, str]:
     """
-    Convert a quantity from one unit to the target system using pint.
+    Convert a quantity from one unit to the target system.
     Returns (converted_quantity, new_unit_display_name).
     If conversion is not possible, returns original quantity and unit.
     """
-    pint_unit = get_pint_unit(from_unit)
-    if pint_unit is None:
-        return quantity, from_unit
-
-    current_system = get_unit_system(pint_unit)
-    if current_system is None or current_system == target_system:
-        return quantity, from_unit
-
-    unit_type = get_unit_type(pint_unit)
-    if unit_type is None:
-        return quantity, from_unit
-
-    target_unit = PREFERRED_UNITS[target_system][unit_type]
-
-    try:
-        # Create pint quantity and convert
-        source_qty = quantity * getattr(ureg, pint_unit)
-        converted = source_qty.to(getattr(ureg, target_unit))
-        converted_value = converted.magnitude
-
-        # Apply simplification if quantity is large
-        if target_unit in SIMPLIFICATION_THRESHOLDS:
-            threshold, larger_unit = SIMPLIFICATION_THRESHOLDS[target_unit]
-            if converted_value >= threshold:
-                simplified = converted.to(getattr(ureg, larger_unit))
-                converted_value = round(simplified.magnitude, 2)
-                target_unit = larger_unit
-            else:
-                converted_value = round(converted_value, 2)
-        else:
-            converted_value = round(converted_value, 2)
-
-        display_name = DISPLAY_NAMES.get(target_unit, target_unit)
-        return converted_value, display_name
-
-    except pint.DimensionalityError:
-        # Can't convert between incompatible units
+    unit_info = get_unit_info(from_unit)
+    if unit_info is None or unit_info[1] == target_system:
         return quantity, from_unit
+    return _convert_known_unit(quantity, unit_info[0])
 
 
 def convert_recipe_units(recipe_dict: dict, target_system: UnitSystem) -> dict:
@@ -288,13 +334,20 @@ def convert_recipe_units(recipe_dict: dict, target_system: UnitSystem) -> dict:
     Convert all ingredient units in a recipe to the target unit system.
     Modifies and returns the recipe dictionary.
     """
-    for component in recipe_dict.get("components", []):
-        for ingredient in component.get("ingredients", []):
-            quantity = ingredient.get("quantity", 0)
-            unit = ingredient.get("unit", "")
-
-            new_quantity, new_unit = convert_quantity(quantity, unit, target_system)
-            ingredient["quantity"] = new_quantity
-            ingredient["unit"] = new_unit
+    # Resolve each ingredient's unit once and keep only those that change.
+    pending = [
+        (ingredient, unit_info[0])
+        for component in recipe_dict.get("components", [])
+        for ingredient in component.get("ingredients", [])
+        if (unit_info := get_unit_info(ingredient.get("unit", ""))) is not None
+        and unit_info[1] != target_system
+    ]
+
+    # Recipes are usually requested in the system they were written in, in
+    # which case nothing is pending and the dict is returned untouched.
+    for ingredient, pint_unit in pending:
+        ingredient["quantity"], ingredient["unit"] = _convert_known_unit(
+            ingredient.get("quantity", 0), pint_unit
+        )
 
     return recipe_dict
@@ -1,53 +1,220 @@
 import pytest
-from typing import Generator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Generator, Optional
+from uuid import UUID
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # It is important to set environment variables before importing app modules
 import os
 
-os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+# Tests run against a private in-memory database, so pytest-xdist workers are
+# isolated for free. The URL keeps "test" in it, which the app uses to switch
+# off rate limiting.
+os.environ["DATABASE_URL"] = "sqlite:///file:testdb?mode=memory&uri=true"
 os.environ["API_STR"] = ""
+# bcrypt's minimum cost (4) is ~256x cheaper than the default of 12 and the
+# tests only need hashes that round-trip, not brute-force resistance.
+os.environ["BCRYPT_ROUNDS"] = "4"
 
+from app import crud, schemas
 from app.db.session import Base, get_db
 from app.main import app
+from tests.helpers import get_auth_headers, mint_access_token
 
-# Create a test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# Create a test database. StaticPool hands every checkout the same connection,
+# which keeps the in-memory database alive and shared between the db fixture
+# and the TestClient's request thread.
+SQLALCHEMY_DATABASE_URL = os.environ["DATABASE_URL"]
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+# pysqlite defers BEGIN until the first DML statement, which breaks SAVEPOINT
+# handling. Take over transaction control so each test can run inside an outer
+# transaction with the session committing into nested savepoints.
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    join_transaction_mode="create_savepoint",
+)
+
+# Session of the currently running test, read by the get_db override so the
+# session-wide TestClient always talks to the test's savepointed session.
+_current_test_session: ContextVar[Optional[Session]] = ContextVar(
+    "_current_test_session", default=None
+)
+
+
+def override_get_db():
+    session = _current_test_session.get()
+    if session is not None:
+        yield session
+        return
+
+    # Client-only tests (no ``db`` fixture) get a throwaway session.
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
 
 
 @pytest.fixture(scope="session", autouse=True)
 def db_engine():
-    # Create tables
+    # Create tables once; the in-memory database vanishes with the process
     Base.metadata.create_all(bind=engine)
     yield engine
-    # Drop tables
-    Base.metadata.drop_all(bind=engine)
-    os.remove("./test.db")
 
 
-@pytest.fixture(scope="function")
-def db(db_engine) -> Generator:
+@pytest.fixture(scope="session")
+def db_connection(db_engine) -> Generator:
+    # One connection shared by the whole run; the db fixture opens a
+    # transaction on it per test and rolls it back afterwards.
     connection = db_engine.connect()
-    transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
-    yield session
-    session.close()
-    transaction.rollback()
+    yield connection
     connection.close()
 
 
 @pytest.fixture(scope="function")
-def client(db) -> Generator:
-    def override_get_db():
-        yield db
+def db(db_connection) -> Generator:
+    # Commits made by the code under test only release a SAVEPOINT; the outer
+    # transaction is rolled back on teardown so every test starts clean.
+    transaction = db_connection.begin()
+    session = TestingSessionLocal(bind=db_connection)
+    token = _current_test_session.set(session)
+    yield session
+    _current_test_session.reset(token)
+    session.close()
+    transaction.rollback()
+
 
+@pytest.fixture(scope="session")
+def client() -> Generator:
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def auth_token_factory(db):
+    """
+    Return make(email, password="password", is_admin=False) -> headers.
+
+    Backed by tests.helpers.get_auth_headers, whose user cache spans the
+    whole session, so a given email's password is hashed at most once.
+    """
+
+    def make(email="user@example.com", password="password", is_admin=False):
+        return get_auth_headers(db, email, password, is_admin=is_admin)
+
+    return make
+
+
+@dataclass(frozen=True)
+class SessionUser:
+    id: UUID
+    email: str
+    headers: dict
+
+
+def _create_session_users(emails, admin_emails=()) -> dict:
+    """
+    Commit users outside any test's rolled-back transaction and mint a token
+    for each.
+
+    Their tokens stay valid for the whole session; anything a test creates
+    with them is still rolled back with that test. Returns {email: SessionUser}.
+    """
+    with TestingSessionLocal() as session:
+        users = [
+            crud.create_user(session, schemas.UserCreate(email=e, password="password"))
+            for e in emails
+        ]
+        for user in users:
+            user.is_admin = user.email in admin_emails
+        session.commit()
+        user_ids = {user.email: user.id for user in users}
+
+    return {
+        email: SessionUser(
+            id=user_id,
+            email=email,
+            headers={"Authorization": f"Bearer {mint_access_token(user_id)}"},
+        )
+        for email, user_id in user_ids.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def session_user() -> SessionUser:
+    """A regular user created and logged in once per test session."""
+    email = "session_user@example.com"
+    return _create_session_users([email])[email]
+
+
+@pytest.fixture(scope="session")
+def auth_headers(session_user) -> dict:
+    return session_user.headers
+
+
+@pytest.fixture(scope="session")
+def auth_client(client, session_user) -> Generator:
+    """A second client that sends session_user's bearer token on every request."""
+    with TestClient(app, headers=session_user.headers) as c:
+        yield c
+
+
+@dataclass(frozen=True)
+class PermissionActors:
+    owner: SessionUser
+    other: SessionUser
+    admin: SessionUser
+    # admin.headers alone never enable admin mode; these add X-Admin-Mode.
+    admin_mode_headers: dict
+
+    def headers_for(self, actor: str, admin_mode: bool = False) -> dict:
+        """Bearer headers for "owner", "other" or "admin", optionally in admin mode."""
+        if admin_mode:
+            assert actor == "admin", "only the admin user can use admin mode"
+            return self.admin_mode_headers
+        return getattr(self, actor).headers
+
+
+_PERMISSION_ACTOR_EMAILS = (
+    "perm_owner@example.com",
+    "perm_other@example.com",
+    "perm_admin@example.com",
+)
+
+
+@pytest.fixture(scope="session")
+def permission_actors() -> PermissionActors:
+    """Owner, non-owner and admin users shared by the permission tests."""
+    owner_email, other_email, admin_email = _PERMISSION_ACTOR_EMAILS
+    users = _create_session_users(_PERMISSION_ACTOR_EMAILS, admin_emails=(admin_email,))
+    admin = users[admin_email]
+    return PermissionActors(
+        owner=users[owner_email],
+        other=users[other_email],
+        admin=admin,
+        admin_mode_headers={**admin.headers, "X-Admin-Mode": "true"},
+    )
@@ -0,0 +1,107 @@
+"""Shared helpers for API tests."""
+
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Iterator
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.api.auth import create_access_token
+from app.core.config import settings
+
+# (email, password) -> (user id, password hash).
+# Each test runs in a rolled-back transaction, so users disappear between
+# tests. Re-inserting a user with the cached id and hash skips the bcrypt hash.
+_USER_CACHE: dict[tuple[str, str], tuple[UUID, str]] = {}
+
+
+def mint_access_token(user_id: UUID) -> str:
+    """
+    Sign a token exactly as POST /auth/token would for this user.
+
+    Skips the login round trip and its bcrypt verify; the login flow itself is
+    covered by the auth tests.
+    """
+    return create_access_token(
+        data={"sub": str(user_id)},
+        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+
+
+def get_auth_headers(
+    db: Session,
+    email: str = "user@example.com",
+    password: str = "password",
+    is_admin: bool = False,
+) -> dict:
+    """Ensure a user exists with the given admin flag and return bearer headers."""
+    key = (email, password)
+    cached = _USER_CACHE.get(key)
+
+    user = crud.get_user_by_email(db, email=email)
+    if user is None and cached is not None:
+        user_id, hashed_password = cached
+        user = models.User(id=user_id, email=email, hashed_password=hashed_password)
+        db.add(user)
+        db.commit()
+    elif user is None:
+        user = crud.create_user(db, schemas.UserCreate(email=email, password=password))
+
+    if user.is_admin != is_admin:
+        user.is_admin = is_admin
+        db.add(user)
+        db.commit()
+
+    _USER_CACHE[key] = (user.id, user.hashed_password)
+    return {"Authorization": f"Bearer {mint_access_token(user.id)}"}
+
+
+@contextmanager
+def count_queries(db: Session) -> Iterator[list[str]]:
+    """Collect the SQL statements run on ``db``'s connection inside the block."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+
+def bulk_create_recipes(db: Session, owner_id: UUID, names: list[str]) -> list[str]:
+    """Insert minimal recipes straight through the ORM and return their ids.
+
+    For tests that only need rows to exist, this skips the POST /recipes/
+    round trip and its per-component flushes.
+    """
+    recipes = [models.Recipe(name=name, owner_id=owner_id) for name in names]
+    db.add_all(recipes)
+    db.commit()
+    return [str(recipe.id) for recipe in recipes]
+
+
+@contextmanager
+def committed_recipe(
+    client: TestClient, recipe_data: dict, headers: dict | None = None
+) -> Iterator[dict]:
+    """POST a recipe for module- or class-scoped fixtures and DELETE it on exit.
+
+    Call it from a fixture that does not request ``db``: the recipe is then
+    committed and visible to every test until the fixture is torn down. The
+    master Ingredient rows it creates outlive the recipe, so give ingredients
+    names no other test uses.
+    """
+    response = client.post("/recipes/", json=recipe_data, headers=headers)
+    assert response.status_code == 201, response.text
+    recipe = response.json()
+    yield recipe
+    response = client.delete(f"/recipes/{recipe['core']['id']}", headers=headers)
+    assert response.status_code == 200, response.text
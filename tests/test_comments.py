@@ -1,35 +1,3 @@
-from fastapi.testclient import TestClient
-from app import crud, schemas
-
-
-def get_auth_headers(
-    client: TestClient, db, email, password="password", is_admin=False
-):
-    # Directly create user in DB
-    try:
-        user_in = schemas.UserCreate(email=email, password=password)
-        user = crud.create_user(db, user_in)
-        if is_admin:
-            user.is_admin = True
-            db.add(user)
-            db.commit()
-    except Exception:
-        # If user exists, update admin status just in case
-        user = crud.get_user_by_email(db, email=email)
-        if user and is_admin != user.is_admin:
-            user.is_admin = is_admin
-            db.add(user)
-            db.commit()
-
-    # Login
-    response = client.post(
-        "/auth/token",
-        data={"username": email, "password": password},
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-
 def create_dummy_recipe(client, headers, name="Test Recipe"):
     recipe_data = {
         "core": {"name": name},
@@ -43,9 +11,9 @@ def create_dummy_recipe(client, headers, name="Test Recipe"):
     return response.json()
 
 
-def test_create_and_read_comment(client, db):
+def test_create_and_read_comment(client, db, auth_token_factory):
     # 1. Create User and Recipe
-    user_headers = get_auth_headers(client, db, email="commenter@example.com")
+    user_headers = auth_token_factory(email="commenter@example.com")
     recipe = create_dummy_recipe(client, user_headers)
     recipe_id = recipe["core"]["id"]
 
@@ -67,14 +35,14 @@ def test_create_and_read_comment(client, db):
     assert comments[0]["text"] == "This is a tasty recipe!"
 
 
-def test_update_comment_permissions(client, db):
+def test_update_comment_permissions(client, db, auth_token_factory):
     # 1. Create Owner and Recipe
-    owner_headers = get_auth_headers(client, db, email="owner_comment@example.com")
+    owner_headers = auth_token_factory(email="owner_comment@example.com")
     recipe = create_dummy_recipe(client, owner_headers)
     recipe_id = recipe["core"]["id"]
 
     # 2. Create Commenter and Comment
-    commenter_headers = get_auth_headers(client, db, email="commenter2@example.com")
+    commenter_headers = auth_token_factory(email="commenter2@example.com")
     comment_data = {"text": "Original comment"}
     res = client.post(
         f"/recipes/{recipe_id}/comments", json=comment_data, headers=commenter_headers
@@ -92,7 +60,7 @@ def test_update_comment_permissions(client, db):
     assert res.json()["text"] == "Updated by owner"
 
     # 4. Another user tries to update -> Forbidden
-    stranger_headers = get_auth_headers(client, db, email="stranger3@example.com")
+    stranger_headers = auth_token_factory(email="stranger3@example.com")
     res = client.put(
         f"/recipes/{recipe_id}/comments/{comment_id}",
         json={"text": "Hacked"},
@@ -109,8 +77,8 @@ def test_update_comment_permissions(client, db):
     assert res.status_code == 403
 
     # 6. Admin with X-Admin-Mode updates -> OK
-    admin_base_headers = get_auth_headers(
-        client, db, email="admin_comment@example.com", is_admin=True
+    admin_base_headers = auth_token_factory(
+        email="admin_comment@example.com", is_admin=True
     )
     admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
     res = client.put(
@@ -122,13 +90,13 @@ def test_update_comment_permissions(client, db):
     assert res.json()["text"] == "Admin Override"
 
 
-def test_delete_comment_permissions(client, db):
+def test_delete_comment_permissions(client, db, auth_token_factory):
     # 1. Setup
-    owner_headers = get_auth_headers(client, db, email="owner_del@example.com")
+    owner_headers = auth_token_factory(email="owner_del@example.com")
     recipe = create_dummy_recipe(client, owner_headers)
     recipe_id = recipe["core"]["id"]
 
-    commenter_headers = get_auth_headers(client, db, email="commenter_del@example.com")
+    commenter_headers = auth_token_factory(email="commenter_del@example.com")
     res = client.post(
         f"/recipes/{recipe_id}/comments",
         json={"text": "To be deleted"},
@@ -137,7 +105,7 @@ def test_delete_comment_permissions(client, db):
     comment_id = res.json()["id"]
 
     # 2. Stranger delete -> Forbidden
-    stranger_headers = get_auth_headers(client, db, email="stranger_del@example.com")
+    stranger_headers = auth_token_factory(email="stranger_del@example.com")
     res = client.delete(
         f"/recipes/{recipe_id}/comments/{comment_id}", headers=stranger_headers
     )
@@ -152,8 +120,8 @@ def test_delete_comment_permissions(client, db):
     # 4. Commenter delete -> OK
     # Re-create comment to delete it
     # Actually wait, let's test admin delete first on this one
-    admin_base_headers = get_auth_headers(
-        client, db, email="admin_del@example.com", is_admin=True
+    admin_base_headers = auth_token_factory(
+        email="admin_del@example.com", is_admin=True
     )
     admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
     res = client.delete(
@@ -1,9 +1,6 @@
-from tests.test_recipe_permissions import get_auth_headers
-
-
-def test_create_recipe_preserves_order(client, db):
+def test_create_recipe_preserves_order(client, db, auth_token_factory):
     # Setup
-    headers = get_auth_headers(client, db, email="order_test@example.com")
+    headers = auth_token_factory(email="order_test@example.com")
 
     # Create Valid Recipe with ingredients in specific order
     recipe_data = {
@@ -42,9 +39,9 @@ def test_create_recipe_preserves_order(client, db):
     assert items == ["Lettuce", "Dressing", "Tomato"]
 
 
-def test_update_recipe_reorders_ingredients(client, db):
+def test_update_recipe_reorders_ingredients(client, db, auth_token_factory):
     # Setup
-    headers = get_auth_headers(client, db, email="order_update@example.com")
+    headers = auth_token_factory(email="order_update@example.com")
 
     # Create initial recipe
     recipe_data = {
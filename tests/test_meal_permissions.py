@@ -9,38 +9,6 @@ Verifies that:
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app import crud, schemas
-
-
-def get_auth_headers(
-    client: TestClient,
-    db: Session,
-    email: str,
-    password: str = "password",
-    is_admin: bool = False,
-):
-    """Create a user and return auth headers."""
-    try:
-        user_in = schemas.UserCreate(email=email, password=password)
-        user = crud.create_user(db, user_in)
-        if is_admin:
-            user.is_admin = True
-            db.add(user)
-            db.commit()
-    except Exception:
-        user = crud.get_user_by_email(db, email=email)
-        if user and is_admin != user.is_admin:
-            user.is_admin = is_admin
-            db.add(user)
-            db.commit()
-
-    response = client.post(
-        "/auth/token",
-        data={"username": email, "password": password},
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
 
 def create_recipe(client: TestClient, headers: dict, name: str = "Test Recipe"):
     """Create a recipe and return its data."""
@@ -94,13 +62,15 @@ def create_meal(
 # =============================================================================
 
 
-def test_any_user_can_read_template_list(client: TestClient, db: Session):
+def test_any_user_can_read_template_list(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Any authenticated user can list all templates."""
-    owner_headers = get_auth_headers(client, db, email="tmpl_owner1@example.com")
+    owner_headers = auth_token_factory(email="tmpl_owner1@example.com")
     template = create_template(client, owner_headers, name="Owner Template")
     template_id = template["id"]
 
-    other_headers = get_auth_headers(client, db, email="tmpl_other1@example.com")
+    other_headers = auth_token_factory(email="tmpl_other1@example.com")
 
     response = client.get("/meals/templates", headers=other_headers)
     assert response.status_code == 200
@@ -109,13 +79,15 @@ def test_any_user_can_read_template_list(client: TestClient, db: Session):
     assert template_id in template_ids
 
 
-def test_any_user_can_read_single_template(client: TestClient, db: Session):
+def test_any_user_can_read_single_template(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Any authenticated user can read a specific template by ID."""
-    owner_headers = get_auth_headers(client, db, email="tmpl_owner2@example.com")
+    owner_headers = auth_token_factory(email="tmpl_owner2@example.com")
     template = create_template(client, owner_headers, name="Readable Template")
     template_id = template["id"]
 
-    other_headers = get_auth_headers(client, db, email="tmpl_other2@example.com")
+    other_headers = auth_token_factory(email="tmpl_other2@example.com")
 
     response = client.get(f"/meals/templates/{template_id}", headers=other_headers)
     assert response.status_code == 200
@@ -123,9 +95,11 @@ def test_any_user_can_read_single_template(client: TestClient, db: Session):
     assert response.json()["name"] == "Readable Template"
 
 
-def test_user_generates_meal_from_own_templates(client: TestClient, db: Session):
+def test_user_generates_meal_from_own_templates(
+    client: TestClient, db: Session, auth_token_factory
+):
     """A user generates meals from their own templates."""
-    user_headers = get_auth_headers(client, db, email="tmpl_owner3@example.com")
+    user_headers = auth_token_factory(email="tmpl_owner3@example.com")
     create_template(client, user_headers, name="My Template")
 
     response = client.post("/meals/generate", headers=user_headers, json={"count": 1})
@@ -141,9 +115,9 @@ def test_user_generates_meal_from_own_templates(client: TestClient, db: Session)
 # =============================================================================
 
 
-def test_owner_can_update_template(client: TestClient, db: Session):
+def test_owner_can_update_template(client: TestClient, db: Session, auth_token_factory):
     """Owner can update their own template."""
-    owner_headers = get_auth_headers(client, db, email="tmpl_owner4@example.com")
+    owner_headers = auth_token_factory(email="tmpl_owner4@example.com")
     template = create_template(client, owner_headers)
     template_id = template["id"]
 
@@ -156,9 +130,9 @@ def test_owner_can_update_template(client: TestClient, db: Session):
     assert response.json()["name"] == "Updated Name"
 
 
-def test_owner_can_delete_template(client: TestClient, db: Session):
+def test_owner_can_delete_template(client: TestClient, db: Session, auth_token_factory):
     """Owner can delete their own template."""
-    owner_headers = get_auth_headers(client, db, email="tmpl_owner5@example.com")
+    owner_headers = auth_token_factory(email="tmpl_owner5@example.com")
     template = create_template(client, owner_headers)
     template_id = template["id"]
 
@@ -174,14 +148,16 @@ def test_owner_can_delete_template(client: TestClient, db: Session):
 # =============================================================================
 
 
-def test_admin_can_update_other_user_template(client: TestClient, db: Session):
+def test_admin_can_update_other_user_template(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Admin with X-Admin-Mode can update another user's template."""
-    owner_headers = get_auth_headers(client, db, email="tmpl_owner6@example.com")
+    owner_headers = auth_token_factory(email="tmpl_owner6@example.com")
     template = create_template(client, owner_headers)
     template_id = template["id"]
 
-    admin_base_headers = get_auth_headers(
-        client, db, email="tmpl_admin1@example.com", is_admin=True
+    admin_base_headers = auth_token_factory(
+        email="tmpl_admin1@example.com", is_admin=True
     )
     admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
 
@@ -194,14 +170,16 @@ def test_admin_can_update_other_user_template(client: TestClient, db: Session):
     assert response.json()["name"] == "Admin Edited"
 
 
-def test_admin_can_delete_other_user_template(client: TestClient, db: Session):
+def test_admin_can_delete_other_user_template(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Admin with X-Admin-Mode can delete another user's template."""
-    owner_headers = get_auth_headers(client, db, email="tmpl_owner7@example.com")
+    owner_headers = auth_token_factory(email="tmpl_owner7@example.com")
     template = create_template(client, owner_headers)
     template_id = template["id"]
 
-    admin_base_headers = get_auth_headers(
-        client, db, email="tmpl_admin2@example.com", is_admin=True
+    admin_base_headers = auth_token_factory(
+        email="tmpl_admin2@example.com", is_admin=True
     )
     admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
 
@@ -217,13 +195,15 @@ def test_admin_can_delete_other_user_template(client: TestClient, db: Session):
 # =============================================================================
 
 
-def test_non_owner_cannot_update_template(client: TestClient, db: Session):
+def test_non_owner_cannot_update_template(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Non-owner, non-admin cannot update another user's template."""
-    owner_headers = get_auth_headers(client, db, email="tmpl_owner8@example.com")
+    owner_headers = auth_token_factory(email="tmpl_owner8@example.com")
     template = create_template(client, owner_headers)
     template_id = template["id"]
 
-    stranger_headers = get_auth_headers(client, db, email="tmpl_stranger1@example.com")
+    stranger_headers = auth_token_factory(email="tmpl_stranger1@example.com")
 
     update_data = {"name": "Hacked"}
     response = client.put(
@@ -234,13 +214,15 @@ def test_non_owner_cannot_update_template(client: TestClient, db: Session):
     assert "Not authorized" in response.json()["detail"]
 
 
-def test_non_owner_cannot_delete_template(client: TestClient, db: Session):
+def test_non_owner_cannot_delete_template(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Non-owner, non-admin cannot delete another user's template."""
-    owner_headers = get_auth_headers(client, db, email="tmpl_owner9@example.com")
+    owner_headers = auth_token_factory(email="tmpl_owner9@example.com")
     template = create_template(client, owner_headers)
     template_id = template["id"]
 
-    stranger_headers = get_auth_headers(client, db, email="tmpl_stranger2@example.com")
+    stranger_headers = auth_token_factory(email="tmpl_stranger2@example.com")
 
     response = client.delete(
         f"/meals/templates/{template_id}", headers=stranger_headers
@@ -255,9 +237,11 @@ def test_non_owner_cannot_delete_template(client: TestClient, db: Session):
 # =============================================================================
 
 
-def test_owner_can_read_own_meal_list(client: TestClient, db: Session):
+def test_owner_can_read_own_meal_list(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Owner can list their own meals; non-owners cannot see them."""
-    owner_headers = get_auth_headers(client, db, email="meal_owner1@example.com")
+    owner_headers = auth_token_factory(email="meal_owner1@example.com")
     template = create_template(client, owner_headers, name="Meal Template 1")
     meal = create_meal(client, owner_headers, template["id"])
     meal_id = meal["id"]
@@ -269,21 +253,23 @@ def test_owner_can_read_own_meal_list(client: TestClient, db: Session):
     assert meal_id in meal_ids
 
     # Other user cannot see the owner's meal
-    other_headers = get_auth_headers(client, db, email="meal_other1@example.com")
+    other_headers = auth_token_factory(email="meal_other1@example.com")
     response = client.get("/meals/", headers=other_headers)
     assert response.status_code == 200
     meal_ids = [m["id"] for m in response.json()]
     assert meal_id not in meal_ids
 
 
-def test_non_owner_cannot_read_single_meal(client: TestClient, db: Session):
+def test_non_owner_cannot_read_single_meal(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Non-owner cannot read another user's meal by ID (returns 403)."""
-    owner_headers = get_auth_headers(client, db, email="meal_owner2@example.com")
+    owner_headers = auth_token_factory(email="meal_owner2@example.com")
     template = create_template(client, owner_headers, name="Meal Template 2")
     meal = create_meal(client, owner_headers, template["id"])
     meal_id = meal["id"]
 
-    other_headers = get_auth_headers(client, db, email="meal_other2@example.com")
+    other_headers = auth_token_factory(email="meal_other2@example.com")
 
     response = client.get(f"/meals/{meal_id}", headers=other_headers)
     assert response.status_code == 403
@@ -294,9 +280,9 @@ def test_non_owner_cannot_read_single_meal(client: TestClient, db: Session):
 # =============================================================================
 
 
-def test_owner_can_update_meal(client: TestClient, db: Session):
+def test_owner_can_update_meal(client: TestClient, db: Session, auth_token_factory):
     """Owner can update their own meal."""
-    owner_headers = get_auth_headers(client, db, email="meal_owner3@example.com")
+    owner_headers = auth_token_factory(email="meal_owner3@example.com")
     template = create_template(client, owner_headers, name="Meal Template 3")
     meal = create_meal(client, owner_headers, template["id"])
     meal_id = meal["id"]
@@ -308,9 +294,9 @@ def test_owner_can_update_meal(client: TestClient, db: Session):
     assert response.json()["name"] == "Updated Meal Name"
 
 
-def test_owner_can_delete_meal(client: TestClient, db: Session):
+def test_owner_can_delete_meal(client: TestClient, db: Session, auth_token_factory):
     """Owner can delete their own meal."""
-    owner_headers = get_auth_headers(client, db, email="meal_owner4@example.com")
+    owner_headers = auth_token_factory(email="meal_owner4@example.com")
     template = create_template(client, owner_headers, name="Meal Template 4")
     meal = create_meal(client, owner_headers, template["id"])
     meal_id = meal["id"]
@@ -327,15 +313,17 @@ def test_owner_can_delete_meal(client: TestClient, db: Session):
 # =============================================================================
 
 
-def test_admin_can_update_other_user_meal(client: TestClient, db: Session):
+def test_admin_can_update_other_user_meal(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Admin with X-Admin-Mode can update another user's meal."""
-    owner_headers = get_auth_headers(client, db, email="meal_owner5@example.com")
+    owner_headers = auth_token_factory(email="meal_owner5@example.com")
     template = create_template(client, owner_headers, name="Meal Template 5")
     meal = create_meal(client, owner_headers, template["id"])
     meal_id = meal["id"]
 
-    admin_base_headers = get_auth_headers(
-        client, db, email="meal_admin1@example.com", is_admin=True
+    admin_base_headers = auth_token_factory(
+        email="meal_admin1@example.com", is_admin=True
     )
     admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
 
@@ -346,15 +334,17 @@ def test_admin_can_update_other_user_meal(client: TestClient, db: Session):
     assert response.json()["name"] == "Admin Edited Meal"
 
 
-def test_admin_can_delete_other_user_meal(client: TestClient, db: Session):
+def test_admin_can_delete_other_user_meal(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Admin with X-Admin-Mode can delete another user's meal."""
-    owner_headers = get_auth_headers(client, db, email="meal_owner6@example.com")
+    owner_headers = auth_token_factory(email="meal_owner6@example.com")
     template = create_template(client, owner_headers, name="Meal Template 6")
     meal = create_meal(client, owner_headers, template["id"])
     meal_id = meal["id"]
 
-    admin_base_headers = get_auth_headers(
-        client, db, email="meal_admin2@example.com", is_admin=True
+    admin_base_headers = auth_token_factory(
+        email="meal_admin2@example.com", is_admin=True
     )
     admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
 
@@ -371,14 +361,16 @@ def test_admin_can_delete_other_user_meal(client: TestClient, db: Session):
 # =============================================================================
 
 
-def test_non_owner_cannot_update_meal(client: TestClient, db: Session):
+def test_non_owner_cannot_update_meal(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Non-owner, non-admin cannot update another user's meal."""
-    owner_headers = get_auth_headers(client, db, email="meal_owner7@example.com")
+    owner_headers = auth_token_factory(email="meal_owner7@example.com")
     template = create_template(client, owner_headers, name="Meal Template 7")
     meal = create_meal(client, owner_headers, template["id"])
     meal_id = meal["id"]
 
-    stranger_headers = get_auth_headers(client, db, email="meal_stranger1@example.com")
+    stranger_headers = auth_token_factory(email="meal_stranger1@example.com")
 
     update_data = {"name": "Hacked Meal"}
     response = client.put(
@@ -389,14 +381,16 @@ def test_non_owner_cannot_update_meal(client: TestClient, db: Session):
     assert "Not authorized" in response.json()["detail"]
 
 
-def test_non_owner_cannot_delete_meal(client: TestClient, db: Session):
+def test_non_owner_cannot_delete_meal(
+    client: TestClient, db: Session, auth_token_factory
+):
     """Non-owner, non-admin cannot delete another user's meal."""
-    owner_headers = get_auth_headers(client, db, email="meal_owner8@example.com")
+    owner_headers = auth_token_factory(email="meal_owner8@example.com")
     template = create_template(client, owner_headers, name="Meal Template 8")
     meal = create_meal(client, owner_headers, template["id"])
     meal_id = meal["id"]
 
-    stranger_headers = get_auth_headers(client, db, email="meal_stranger2@example.com")
+    stranger_headers = auth_token_factory(email="meal_stranger2@example.com")
 
     response = client.delete(f"/meals/{meal_id}", headers=stranger_headers)
 
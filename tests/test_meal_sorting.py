@@ -3,25 +3,8 @@ from datetime import datetime, timedelta
 from app import crud, schemas
 
 
-def get_auth_headers(
-    client: TestClient, db, email="user_meal_sorting@example.com", password="password"
-):
-    try:
-        user_in = schemas.UserCreate(email=email, password=password)
-        crud.create_user(db, user_in)
-    except Exception:
-        pass
-
-    response = client.post(
-        "/auth/token",
-        data={"username": email, "password": password},
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-
-def test_meals_sorting(client: TestClient, db):
-    headers = get_auth_headers(client, db)
+def test_meals_sorting(client: TestClient, db, auth_token_factory):
+    headers = auth_token_factory(email="user_meal_sorting@example.com")
 
     # Get user id
     user = crud.get_user_by_email(db, "user_meal_sorting@example.com")
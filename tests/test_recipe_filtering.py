@@ -1,8 +1,11 @@
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app.filters import parse_filters, Filter
-from app import crud, schemas
+from uuid import uuid4
+
+from app.filters import apply_filters, parse_filters, Filter
+from app import crud, models
+from tests.helpers import bulk_create_recipes
 
 # --- Unit Tests ---
 
@@ -44,6 +47,15 @@ def test_parse_filters_invalid_format():
     assert len(filters) == 0
 
 
+def test_id_in_filter_compiles_to_single_in_clause(db: Session):
+    ids = [str(uuid4()) for _ in range(3)]
+    query = apply_filters(db.query(models.Recipe), [Filter("id", "in", ",".join(ids))])
+
+    sql = str(query.statement.compile(compile_kwargs={"literal_binds": True}))
+    assert " IN (" in sql
+    assert " OR " not in sql
+
+
 # --- Integration Tests (using DB) ---
 
 # --- Integration Tests (using DB) ---
@@ -104,41 +116,14 @@ def test_meta_endpoints(db: Session):
 # --- API / Client Tests ---
 
 
-def get_auth_headers(
-    client: TestClient, db, email="user_filter_id@example.com", password="password"
-):
-    try:
-        user_in = schemas.UserCreate(email=email, password=password)
-        crud.create_user(db, user_in)
-    except Exception:
-        pass
-
-    response = client.post(
-        "/auth/token",
-        data={"username": email, "password": password},
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-
-def test_filter_by_id_collection(client: TestClient, db):
-    headers = get_auth_headers(client, db)
+def test_filter_by_id_collection(client: TestClient, db, auth_token_factory):
+    headers = auth_token_factory(email="user_filter_id@example.com")
+    user = crud.get_user_by_email(db, email="user_filter_id@example.com")
 
     # Create 3 recipes
-    def create_simple_recipe(name):
-        data = {
-            "core": {"name": name},
-            "times": {},
-            "nutrition": {},
-            "components": [],
-            "instructions": [],
-        }
-        res = client.post("/recipes/", json=data, headers=headers)
-        return res.json()["core"]["id"]
-
-    id1 = create_simple_recipe("Recipe 1")
-    id2 = create_simple_recipe("Recipe 2")
-    id3 = create_simple_recipe("Recipe 3")
+    id1, id2, id3 = bulk_create_recipes(
+        db, user.id, ["Recipe 1", "Recipe 2", "Recipe 3"]
+    )
 
     # Filter for ID 1 and 3
     query_ids = f"{id1},{id3}"
@@ -161,8 +146,8 @@ def test_filter_by_id_collection(client: TestClient, db):
     assert id2 not in returned_ids
 
 
-def test_filter_recipes_by_ingredients_like(client: TestClient, db):
-    headers = get_auth_headers(client, db, email="user_ing_like@example.com")
+def test_filter_recipes_by_ingredients_like(client: TestClient, db, auth_token_factory):
+    headers = auth_token_factory(email="user_ing_like@example.com")
 
     # Create recipes
     def create_recipe_with_ingredients(name, ingredients):
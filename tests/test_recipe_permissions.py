@@ -1,35 +1,3 @@
-from fastapi.testclient import TestClient
-from app import crud, schemas
-
-
-def get_auth_headers(
-    client: TestClient, db, email, password="password", is_admin=False
-):
-    # Directly create user in DB
-    try:
-        user_in = schemas.UserCreate(email=email, password=password)
-        user = crud.create_user(db, user_in)
-        if is_admin:
-            user.is_admin = True
-            db.add(user)
-            db.commit()
-    except Exception:
-        # If user exists, update admin status just in case
-        user = crud.get_user_by_email(db, email=email)
-        if user and is_admin != user.is_admin:
-            user.is_admin = is_admin
-            db.add(user)
-            db.commit()
-
-    # Login
-    response = client.post(
-        "/auth/token",
-        data={"username": email, "password": password},
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-
 def create_dummy_recipe(client, headers, name="Test Recipe"):
     recipe_data = {
         "core": {"name": name},
@@ -43,19 +11,12 @@ def create_dummy_recipe(client, headers, name="Test Recipe"):
     return response.json()
 
 
-def test_admin_can_update_other_user_recipe(client, db):
-    # 1. Create User A (Owner)
-    owner_headers = get_auth_headers(client, db, email="owner@example.com")
-    recipe = create_dummy_recipe(client, owner_headers)
+def test_admin_can_update_other_user_recipe(client, db, permission_actors):
+    # 1. Owner creates a recipe
+    recipe = create_dummy_recipe(client, permission_actors.owner.headers)
     recipe_id = recipe["core"]["id"]
 
-    # 2. Create Admin User with X-Admin-Mode header
-    admin_base_headers = get_auth_headers(
-        client, db, email="admin@example.com", is_admin=True
-    )
-    admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
-
-    # 3. Admin tries to update
+    # 2. Admin (with X-Admin-Mode header) tries to update
     update_data = {
         "core": {"name": "Admin Edited"},
         "times": {},
@@ -64,47 +25,42 @@ def test_admin_can_update_other_user_recipe(client, db):
         "instructions": [],
     }
     response = client.put(
-        f"/recipes/{recipe_id}", json=update_data, headers=admin_headers
+        f"/recipes/{recipe_id}",
+        json=update_data,
+        headers=permission_actors.admin_mode_headers,
     )
 
-    # 4. Assert Success
+    # 3. Assert Success
     assert response.status_code == 200
     assert response.json()["core"]["name"] == "Admin Edited"
 
 
-def test_admin_can_delete_other_user_recipe(client, db):
-    # 1. Create User A (Owner)
-    owner_headers = get_auth_headers(client, db, email="owner2@example.com")
-    recipe = create_dummy_recipe(client, owner_headers)
+def test_admin_can_delete_other_user_recipe(client, db, permission_actors):
+    # 1. Owner creates a recipe
+    recipe = create_dummy_recipe(client, permission_actors.owner.headers)
     recipe_id = recipe["core"]["id"]
 
-    # 2. Create Admin User with X-Admin-Mode header
-    admin_base_headers = get_auth_headers(
-        client, db, email="admin2@example.com", is_admin=True
+    # 2. Admin (with X-Admin-Mode header) tries to delete
+    response = client.delete(
+        f"/recipes/{recipe_id}", headers=permission_actors.admin_mode_headers
     )
-    admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
 
-    # 3. Admin tries to delete
-    response = client.delete(f"/recipes/{recipe_id}", headers=admin_headers)
-
-    # 4. Assert Success
+    # 3. Assert Success
     assert response.status_code == 200
 
     # Verify deletion
-    get_res = client.get(f"/recipes/{recipe_id}", headers=owner_headers)
+    get_res = client.get(
+        f"/recipes/{recipe_id}", headers=permission_actors.owner.headers
+    )
     assert get_res.status_code == 404
 
 
-def test_non_owner_cannot_update(client, db):
-    # 1. Create User A (Owner)
-    owner_headers = get_auth_headers(client, db, email="owner3@example.com")
-    recipe = create_dummy_recipe(client, owner_headers)
+def test_non_owner_cannot_update(client, db, permission_actors):
+    # 1. Owner creates a recipe
+    recipe = create_dummy_recipe(client, permission_actors.owner.headers)
     recipe_id = recipe["core"]["id"]
 
-    # 2. Create User B (Stranger)
-    stranger_headers = get_auth_headers(client, db, email="stranger@example.com")
-
-    # 3. Stranger tries to update
+    # 2. Stranger tries to update
     update_data = {
         "core": {"name": "Hacked"},
         "times": {},
@@ -113,24 +69,24 @@ def test_non_owner_cannot_update(client, db):
         "instructions": [],
     }
     response = client.put(
-        f"/recipes/{recipe_id}", json=update_data, headers=stranger_headers
+        f"/recipes/{recipe_id}",
+        json=update_data,
+        headers=permission_actors.other.headers,
     )
 
-    # 4. Assert Failure
+    # 3. Assert Failure
     assert response.status_code == 403
 
 
-def test_non_owner_cannot_delete(client, db):
-    # 1. Create User A (Owner)
-    owner_headers = get_auth_headers(client, db, email="owner4@example.com")
-    recipe = create_dummy_recipe(client, owner_headers)
+def test_non_owner_cannot_delete(client, db, permission_actors):
+    # 1. Owner creates a recipe
+    recipe = create_dummy_recipe(client, permission_actors.owner.headers)
     recipe_id = recipe["core"]["id"]
 
-    # 2. Create User B (Stranger)
-    stranger_headers = get_auth_headers(client, db, email="stranger2@example.com")
-
-    # 3. Stranger tries to delete
-    response = client.delete(f"/recipes/{recipe_id}", headers=stranger_headers)
+    # 2. Stranger tries to delete
+    response = client.delete(
+        f"/recipes/{recipe_id}", headers=permission_actors.other.headers
+    )
 
-    # 4. Assert Failure
+    # 3. Assert Failure
     assert response.status_code == 403
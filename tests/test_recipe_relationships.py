@@ -1,26 +1,11 @@
+import pytest
 from fastapi.testclient import TestClient
-from app import crud, schemas
-from uuid import uuid4, UUID
+from app import crud
+from uuid import UUID
 
-# --- Helpers ---
-
-
-def get_auth_headers(
-    client: TestClient, db, email_prefix="user_rel", password="password"
-):
-    email = f"{email_prefix}_{uuid4()}@example.com"
-    try:
-        user_in = schemas.UserCreate(email=email, password=password)
-        crud.create_user(db, user_in)
-    except Exception:
-        pass
+from tests.helpers import count_queries
 
-    response = client.post(
-        "/auth/token",
-        data={"username": email, "password": password},
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+# --- Helpers ---
 
 
 def create_recipe(client, headers, name, parent_id=None):
@@ -55,8 +40,8 @@ def update_recipe_parent(client, headers, recipe_id, parent_id):
 # --- Tests ---
 
 
-def test_recipe_children_exposed(client: TestClient, db):
-    headers = get_auth_headers(client, db, "user_children")
+def test_recipe_children_exposed(client: TestClient, db, auth_token_factory):
+    headers = auth_token_factory(email="user_children@example.com")
 
     # 1. Create Parent Recipe
     parent_data = {
@@ -106,8 +91,8 @@ def test_recipe_children_exposed(client: TestClient, db):
     assert c_data["parent_recipe_id"] == parent_id
 
 
-def test_circular_dependency(client: TestClient, db):
-    headers = get_auth_headers(client, db, "user_loops")
+def test_circular_dependency(client: TestClient, db, auth_token_factory):
+    headers = auth_token_factory(email="user_loops@example.com")
 
     # 1. Create A
     id_a = create_recipe(client, headers, "Recipe A")
@@ -157,3 +142,25 @@ def test_circular_dependency(client: TestClient, db):
     res = update_recipe_parent(client, headers, id_a, id_c)
     assert res.status_code == 400
     assert "Cycle detected" in res.json()["detail"]
+
+
+def test_check_cycle_walks_chain_in_one_query(
+    client: TestClient, db, auth_token_factory
+):
+    headers = auth_token_factory(email="user_chain@example.com")
+
+    # Chain: A <- B <- C <- D
+    id_a = create_recipe(client, headers, "Chain A")
+    id_b = create_recipe(client, headers, "Chain B", parent_id=id_a)
+    id_c = create_recipe(client, headers, "Chain C", parent_id=id_b)
+    id_d = create_recipe(client, headers, "Chain D", parent_id=id_c)
+    id_e = create_recipe(client, headers, "Unrelated E")
+
+    # Reparenting onto an unrelated recipe is fine
+    crud.check_cycle(db, UUID(id_a), UUID(id_e))
+
+    with count_queries(db) as statements:
+        with pytest.raises(ValueError, match="Cycle detected"):
+            crud.check_cycle(db, UUID(id_a), UUID(id_d))
+
+    assert len(statements) == 1
@@ -1,40 +1,7 @@
 from fastapi.testclient import TestClient
-from app import crud, schemas
+from app import crud, models, schemas
 from uuid import uuid4
 
-# --- Helper Functions ---
-
-
-def get_auth_headers(
-    client: TestClient, db, email="user_sorting@example.com", password="password"
-):
-    try:
-        user_in = schemas.UserCreate(email=email, password=password)
-        crud.create_user(db, user_in)
-    except Exception:
-        pass
-
-    response = client.post(
-        "/auth/token",
-        data={"username": email, "password": password},
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-
-def create_recipe_with_fields(client, headers, name, category, cuisine):
-    data = {
-        "core": {"name": name, "category": category, "cuisine": cuisine},
-        "times": {},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    res = client.post("/recipes/", json=data, headers=headers)
-    assert res.status_code == 201
-    return res.json()
-
-
 # --- Tests ---
 
 
@@ -53,15 +20,21 @@ def test_recipes_sorted_by_name(db):
     # Create recipes in non-alphabetical order
     recipes_data = ["Zucchini Bread", "Apple Pie", "Banana Cake"]
 
-    for name in recipes_data:
-        recipe_in = schemas.RecipeCreate(
-            core=schemas.RecipeCoreCreate(name=name),
-            times=schemas.RecipeTimes(),
-            nutrition=schemas.RecipeNutrition(),
-            components=[schemas.ComponentCreate(name="Main", ingredients=[])],
+    # model_construct skips validation; only safe because the test controls
+    # every input here.
+    recipes_in = [
+        schemas.RecipeCreate.model_construct(
+            core=schemas.RecipeCoreCreate.model_construct(name=name),
+            times=schemas.RecipeTimes.model_construct(),
+            nutrition=schemas.RecipeNutrition.model_construct(),
+            components=[
+                schemas.ComponentCreate.model_construct(name="Main", ingredients=[])
+            ],
             instructions=[],
         )
-        crud.create_user_recipe(db=db, recipe=recipe_in, user_id=user.id)
+        for name in recipes_data
+    ]
+    crud.create_user_recipes_bulk(db=db, recipes=recipes_in, user_id=user.id)
 
     # Retrieve recipes
     recipes, _ = crud.get_recipes(db=db, skip=0, limit=100, sort_by="name")
@@ -84,11 +57,11 @@ def test_recipes_sorted_by_name(db):
         assert name in recipe_names
 
 
-def test_instruction_ordering_repro(client: TestClient, db):
+def test_instruction_ordering_repro(client: TestClient, db, auth_token_factory):
     """
     Test that instructions are returned in the correct order (by step_number).
     """
-    headers = get_auth_headers(client, db, email="order_instr@example.com")
+    headers = auth_token_factory(email="order_instr@example.com")
 
     recipe_data = {
         "core": {"name": "Ordering Test", "yield_amount": 1},
@@ -121,20 +94,33 @@ def test_instruction_ordering_repro(client: TestClient, db):
     assert step_numbers == [1, 2, 3], f"Expected [1, 2, 3] but got {step_numbers}"
 
 
-def test_multi_field_sorting(client: TestClient, db):
+def test_multi_field_sorting(client: TestClient, db, auth_token_factory):
     """
     Test sorting by category and cuisine via API.
     """
-    headers = get_auth_headers(client, db, email="sorting_bug_multi@example.com")
+    headers = auth_token_factory(email="sorting_bug_multi@example.com")
 
     # Create 3 recipes with distinct category/cuisine
     # R1: Cat=C, Cuis=A
     # R2: Cat=A, Cuis=C
     # R3: Cat=B, Cuis=B
 
-    create_recipe_with_fields(client, headers, "R1", "Dessert", "American")
-    create_recipe_with_fields(client, headers, "R2", "Appetizer", "Chinese")
-    create_recipe_with_fields(client, headers, "R3", "Beverage", "British")
+    # Inserted directly: only the sort order is under test, not creation
+    user = crud.get_user_by_email(db, email="sorting_bug_multi@example.com")
+    db.add_all(
+        [
+            models.Recipe(
+                name="R1", category="Dessert", cuisine="American", owner_id=user.id
+            ),
+            models.Recipe(
+                name="R2", category="Appetizer", cuisine="Chinese", owner_id=user.id
+            ),
+            models.Recipe(
+                name="R3", category="Beverage", cuisine="British", owner_id=user.id
+            ),
+        ]
+    )
+    db.commit()
 
     # Sort by Category (Asc) -> R2 (App), R3 (Bev), R1 (Des)
     res = client.get("/recipes/?sort=category", headers=headers)
@@ -1,29 +1,47 @@
-import time
 from datetime import datetime, timezone, timedelta
 from fastapi.testclient import TestClient
-from tests.test_recipes import get_auth_headers
+from app.core import time as app_time
 
 
-def test_recipe_versioning_logic(client: TestClient, db):
-    headers = get_auth_headers(client, db, email="version_tester@example.com")
-
-    # 1. Create Recipe
-    recipe_data = {
-        "core": {"name": "Version Test", "description": "v1"},
+# Each call builds a fresh payload, so a test can mutate it freely.
+def _versioning_payload(name="Version Test", quantity=100, audit=None):
+    payload = {
+        "core": {"name": name, "description": "v1"},
         "times": {},
         "nutrition": {},
         "components": [
             {
                 "name": "Main",
                 "ingredients": [
-                    {"ingredient_name": "Sugar", "quantity": 100, "unit": "g"}
+                    {"ingredient_name": "Sugar", "quantity": quantity, "unit": "g"}
                 ],
             }
         ],
         "instructions": [{"step_number": 1, "text": "Mix"}],
     }
+    if audit is not None:
+        payload["audit"] = audit
+    return payload
+
+
+def _timestamp_payload(name="Time Test", audit=None):
+    payload = {
+        "core": {"name": name, "description": "Checking clocks"},
+        "times": {},
+        "nutrition": {},
+        "components": [],
+        "instructions": [],
+    }
+    if audit is not None:
+        payload["audit"] = audit
+    return payload
 
-    create_resp = client.post("/recipes/", json=recipe_data, headers=headers)
+
+def test_recipe_versioning_logic(client: TestClient, db, auth_token_factory):
+    headers = auth_token_factory(email="version_tester@example.com")
+
+    # 1. Create Recipe
+    create_resp = client.post("/recipes/", json=_versioning_payload(), headers=headers)
     assert create_resp.status_code == 201
     recipe = create_resp.json()
     recipe_id = recipe["core"]["id"]
@@ -32,9 +50,8 @@ def test_recipe_versioning_logic(client: TestClient, db):
     assert recipe["audit"]["version"] == 1
 
     # 2. Idempotent Update (Same Content)
-    update_data = recipe_data.copy()
-    # Ensure we strictly copy the data structure as expected by update endpoint
-    # The update endpoint expects RecipeCreate schema, which matches our recipe_data structure
+    # The update endpoint expects RecipeCreate schema, which matches the create payload
+    update_data = _versioning_payload()
 
     update_resp = client.put(f"/recipes/{recipe_id}", json=update_data, headers=headers)
     assert update_resp.status_code == 200
@@ -44,7 +61,7 @@ def test_recipe_versioning_logic(client: TestClient, db):
     assert updated_recipe["audit"]["version"] == 1
 
     # 3. Content Update (Change Name)
-    update_data["core"]["name"] = "Version Test V2"
+    update_data = _versioning_payload(name="Version Test V2")
     update_resp_v2 = client.put(
         f"/recipes/{recipe_id}", json=update_data, headers=headers
     )
@@ -55,7 +72,7 @@ def test_recipe_versioning_logic(client: TestClient, db):
     assert updated_recipe_v2["audit"]["version"] == 2
 
     # 4. Content Update (Change Ingredient Quantity)
-    update_data["components"][0]["ingredients"][0]["quantity"] = 200
+    update_data = _versioning_payload(name="Version Test V2", quantity=200)
     update_resp_v3 = client.put(
         f"/recipes/{recipe_id}", json=update_data, headers=headers
     )
@@ -69,7 +86,9 @@ def test_recipe_versioning_logic(client: TestClient, db):
     # Update with Explicit Timestamp
     # Using a fake future date to verify explicit set works
     future_time = "2099-01-01T12:00:00Z"
-    update_data["audit"] = {"updated_at": future_time}
+    update_data = _versioning_payload(
+        name="Version Test V2", quantity=200, audit={"updated_at": future_time}
+    )
     update_resp_v4 = client.put(
         f"/recipes/{recipe_id}", json=update_data, headers=headers
     )
@@ -81,20 +100,13 @@ def test_recipe_versioning_logic(client: TestClient, db):
     assert updated_recipe_v4["audit"]["updated_at"].startswith("2099-01-01")
 
 
-def test_timestamp_behavior(client: TestClient, db):
-    headers = get_auth_headers(client, db, email="time_tester@example.com")
+def test_timestamp_behavior(client: TestClient, db, monkeypatch, auth_token_factory):
+    headers = auth_token_factory(email="time_tester@example.com")
 
     # 1. Create Recipe (Default Timestamps)
-    recipe_data = {
-        "core": {"name": "Time Test", "description": "Checking clocks"},
-        "times": {},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-
-    start_time = datetime.now(timezone.utc)
-    create_resp = client.post("/recipes/", json=recipe_data, headers=headers)
+    frozen_now = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(app_time, "now", lambda: frozen_now)
+    create_resp = client.post("/recipes/", json=_timestamp_payload(), headers=headers)
     assert create_resp.status_code == 201
     recipe = create_resp.json()
     recipe_id = recipe["core"]["id"]
@@ -110,17 +122,12 @@ def test_timestamp_behavior(client: TestClient, db):
     if parsed_created.tzinfo is None:
         parsed_created = parsed_created.replace(tzinfo=timezone.utc)
 
-    assert (
-        start_time - timedelta(minutes=1)
-        < parsed_created
-        < start_time + timedelta(minutes=1)
-    )
+    assert parsed_created == frozen_now
 
     # 2. Update Recipe (Implicit Update Time)
-    time.sleep(1.1)
+    monkeypatch.setattr(app_time, "now", lambda: frozen_now + timedelta(seconds=1))
 
-    update_data = recipe_data.copy()
-    update_data["core"]["name"] = "Time Test Updated"
+    update_data = _timestamp_payload(name="Time Test Updated")
 
     update_resp = client.put(f"/recipes/{recipe_id}", json=update_data, headers=headers)
     assert update_resp.status_code == 200
@@ -139,11 +146,9 @@ def test_timestamp_behavior(client: TestClient, db):
     explicit_created = "2020-01-01T10:00:00+00:00"
     explicit_updated = "2020-01-01T11:00:00+00:00"
 
-    recipe_data_explicit = recipe_data.copy()
-    recipe_data_explicit["audit"] = {
-        "created_at": explicit_created,
-        "updated_at": explicit_updated,
-    }
+    recipe_data_explicit = _timestamp_payload(
+        audit={"created_at": explicit_created, "updated_at": explicit_updated}
+    )
 
     create_resp_2 = client.post("/recipes/", json=recipe_data_explicit, headers=headers)
     assert create_resp_2.status_code == 201
@@ -154,8 +159,9 @@ def test_timestamp_behavior(client: TestClient, db):
 
     # 4. Explicit Update Timestamp
     future_time = "2100-01-01T00:00:00+00:00"
-    update_data_explicit = update_data.copy()
-    update_data_explicit["audit"] = {"updated_at": future_time}
+    update_data_explicit = _timestamp_payload(
+        name="Time Test Updated", audit={"updated_at": future_time}
+    )
 
     update_resp_explicit = client.put(
         f"/recipes/{recipe_id}", json=update_data_explicit, headers=headers
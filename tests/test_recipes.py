@@ -1,32 +1,15 @@
-from fastapi.testclient import TestClient
-
-from app import crud, schemas
-
+import json
 
-def get_auth_headers(
-    client: TestClient, db, email="user@example.com", password="password"
-):
-    # Directly create user in DB
-    try:
-        user_in = schemas.UserCreate(email=email, password=password)
-        crud.create_user(db, user_in)
-    except Exception:
-        # Ignore duplicate email errors if user already exists
-        pass
-
-    # Login
-    response = client.post(
-        "/auth/token",
-        data={"username": email, "password": password},
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+import pytest
+from fastapi.testclient import TestClient
 
+from tests.helpers import bulk_create_recipes, committed_recipe, count_queries
 
-def test_create_recipe(client: TestClient, db):
-    headers = get_auth_headers(client, db)
+# Pre-encoded request bodies; bytes are immutable, so tests can share them.
+JSON_CONTENT = {"Content-Type": "application/json"}
 
-    recipe_data = {
+PANCAKE_JSON = json.dumps(
+    {
         "core": {
             "name": "Pancakes",
             "description": "Fluffy breakfast",
@@ -51,7 +34,21 @@ def test_create_recipe(client: TestClient, db):
         ],
         "suitable_for_diet": ["vegetarian", "low-calorie"],
     }
-    response = client.post("/recipes/", json=recipe_data, headers=headers)
+).encode()
+
+TOAST_JSON = json.dumps(
+    {
+        "core": {"name": "Toast", "yield_amount": 1},
+        "times": {"prep_time_minutes": 1},
+        "nutrition": {},
+        "components": [],
+        "instructions": [],
+    }
+).encode()
+
+
+def test_create_recipe(auth_client: TestClient, db):
+    response = auth_client.post("/recipes/", content=PANCAKE_JSON, headers=JSON_CONTENT)
     assert response.status_code == 201, response.text
     data = response.json()
     assert data["core"]["name"] == "Pancakes"
@@ -62,355 +59,202 @@ def test_create_recipe(client: TestClient, db):
     assert "low-calorie" in data["suitable_for_diet"]
 
 
-def test_read_recipes(client: TestClient, db):
+def test_read_recipes(auth_client: TestClient, db):
     # Create a recipe first
-    headers = get_auth_headers(client, db)
-
-    recipe_data = {
-        "core": {"name": "Toast", "yield_amount": 1},
-        "times": {"prep_time_minutes": 1},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    client.post("/recipes/", json=recipe_data, headers=headers)
+    create_res = auth_client.post("/recipes/", content=TOAST_JSON, headers=JSON_CONTENT)
+    recipe_id = create_res.json()["core"]["id"]
 
-    # Read
-    response = client.get("/recipes/", headers=headers)
+    # Read, narrowed to the new recipe so rows other fixtures committed
+    # cannot come first.
+    response = auth_client.get("/recipes/", params={"id[eq]": recipe_id})
     assert response.status_code == 200
-    assert response.headers["X-Total-Count"]
-    assert int(response.headers["X-Total-Count"]) >= 1
+    assert response.headers["X-Total-Count"] == "1"
     data = response.json()
-    assert len(data) >= 1
+    assert len(data) == 1
     assert data[0]["core"]["name"] == "Toast"
 
 
-def test_read_recipe_by_id(client: TestClient, db):
-    headers = get_auth_headers(client, db)
+def test_read_recipes_query_count_independent_of_page_size(
+    auth_client: TestClient, db, session_user
+):
+    def count_list_queries():
+        with count_queries(db) as statements:
+            response = auth_client.get("/recipes/")
+        assert response.status_code == 200
+        return len(statements)
 
-    recipe_data = {
-        "core": {"name": "Soup", "yield_amount": 4},
-        "times": {"prep_time_minutes": 10},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
+    bulk_create_recipes(db, session_user.id, ["List 1"])
+    one_recipe = count_list_queries()
 
-    response = client.get(f"/recipes/{recipe_id}", headers=headers)
-    assert response.status_code == 200
-    assert response.json()["core"]["name"] == "Soup"
+    bulk_create_recipes(db, session_user.id, ["List 2", "List 3", "List 4"])
+    four_recipes = count_list_queries()
 
+    assert four_recipes == one_recipe
 
-def test_update_recipe(client: TestClient, db):
-    headers = get_auth_headers(client, db)
 
-    recipe_data = {
-        "core": {"name": "Old Name", "yield_amount": 1},
-        "times": {"prep_time_minutes": 5},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
-
-    update_data = recipe_data.copy()
-    update_data["core"]["name"] = "New Name"
-    update_data["suitable_for_diet"] = ["vegan"]
-    # Need to send all required fields. Pydantic schema validation!
+SAMPLE_RECIPE = {
+    "core": {"name": "Soup", "yield_amount": 4},
+    "times": {"prep_time_minutes": 10},
+    "nutrition": {},
+    "components": [],
+    "instructions": [],
+}
 
-    response = client.put(f"/recipes/{recipe_id}", json=update_data, headers=headers)
-    assert response.status_code == 200
-    assert response.json()["core"]["name"] == "New Name"
-    assert response.json()["suitable_for_diet"] == ["vegan"]
 
+@pytest.fixture(scope="module")
+def sample_recipe(auth_client: TestClient):
+    # Tests that modify it request db, so their changes are rolled back
+    # before the next test.
+    with committed_recipe(auth_client, SAMPLE_RECIPE) as recipe:
+        yield recipe
 
-def test_delete_recipe(client: TestClient, db):
-    headers = get_auth_headers(client, db)
 
-    recipe_data = {
-        "core": {"name": "To Delete"},
-        "times": {},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
-
-    response = client.delete(f"/recipes/{recipe_id}", headers=headers)
-    assert response.status_code == 200
-
-    # Verify it's gone
-    get_res = client.get(f"/recipes/{recipe_id}", headers=headers)
-    assert get_res.status_code == 404
-
-
-# --- Ingredient Scaling Tests ---
+@pytest.fixture
+def recipe_to_delete(auth_client: TestClient, db):
+    response = auth_client.post(
+        "/recipes/", json={**SAMPLE_RECIPE, "core": {"name": "To Delete"}}
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
 
 
-def test_read_recipe_with_scale_factor(client: TestClient, db):
-    """Test that scale parameter correctly multiplies ingredient quantities."""
-    headers = get_auth_headers(client, db)
+def test_read_recipe_by_id(auth_client: TestClient, db, sample_recipe):
+    recipe_id = sample_recipe["core"]["id"]
 
-    recipe_data = {
-        "core": {"name": "Scaled Recipe", "yield_amount": 4},
-        "times": {"prep_time_minutes": 10},
-        "nutrition": {"calories": 200},
-        "components": [
-            {
-                "name": "Main",
-                "ingredients": [
-                    {"ingredient_name": "Flour", "quantity": 2.0, "unit": "cups"},
-                    {"ingredient_name": "Sugar", "quantity": 0.5, "unit": "cups"},
-                ],
-            }
-        ],
-        "instructions": [{"step_number": 1, "text": "Mix"}],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
-
-    # Test scale=2 (double)
-    response = client.get(f"/recipes/{recipe_id}?scale=2", headers=headers)
+    response = auth_client.get(f"/recipes/{recipe_id}")
     assert response.status_code == 200
-    data = response.json()
-
-    # Verify quantities are doubled
-    ingredients = data["components"][0]["ingredients"]
-    assert ingredients[0]["quantity"] == 4.0  # 2 * 2
-    assert ingredients[1]["quantity"] == 1.0  # 0.5 * 2
-
-    # Verify yield_amount is also scaled
-    assert data["core"]["yield_amount"] == 8  # 4 * 2
+    assert response.json()["core"]["name"] == "Soup"
 
 
-def test_read_recipe_with_scale_half(client: TestClient, db):
-    """Test that scale=0.5 halves ingredient quantities."""
-    headers = get_auth_headers(client, db)
+def test_update_recipe(auth_client: TestClient, db, sample_recipe):
+    recipe_id = sample_recipe["core"]["id"]
 
-    recipe_data = {
-        "core": {"name": "Half Recipe", "yield_amount": 4},
-        "times": {},
-        "nutrition": {},
-        "components": [
-            {
-                "name": "Main",
-                "ingredients": [
-                    {"ingredient_name": "Butter", "quantity": 1.0, "unit": "cup"},
-                ],
-            }
-        ],
-        "instructions": [],
+    # Need to send all required fields. Pydantic schema validation!
+    update_data = {
+        **SAMPLE_RECIPE,
+        "core": {**SAMPLE_RECIPE["core"], "name": "New Name"},
+        "suitable_for_diet": ["vegan"],
     }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
 
-    response = client.get(f"/recipes/{recipe_id}?scale=0.5", headers=headers)
+    response = auth_client.put(f"/recipes/{recipe_id}", json=update_data)
     assert response.status_code == 200
     data = response.json()
+    assert data["core"]["name"] == "New Name"
+    assert data["suitable_for_diet"] == ["vegan"]
 
-    assert data["components"][0]["ingredients"][0]["quantity"] == 0.5
-    assert data["core"]["yield_amount"] == 2
 
+def test_delete_recipe(auth_client: TestClient, db, recipe_to_delete):
+    recipe_id = recipe_to_delete["core"]["id"]
 
-def test_read_recipe_scale_one_unchanged(client: TestClient, db):
-    """Test that scale=1 returns quantities unchanged."""
-    headers = get_auth_headers(client, db)
-
-    recipe_data = {
-        "core": {"name": "No Change Recipe"},
-        "times": {},
-        "nutrition": {},
-        "components": [
-            {
-                "name": "Main",
-                "ingredients": [
-                    {"ingredient_name": "Salt", "quantity": 1.5, "unit": "tsp"},
-                ],
-            }
-        ],
-        "instructions": [],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
-
-    response = client.get(f"/recipes/{recipe_id}?scale=1", headers=headers)
+    response = auth_client.delete(f"/recipes/{recipe_id}")
     assert response.status_code == 200
-    data = response.json()
-
-    assert data["components"][0]["ingredients"][0]["quantity"] == 1.5
 
+    # Verify it's gone
+    get_res = auth_client.get(f"/recipes/{recipe_id}")
+    assert get_res.status_code == 404
 
-def test_read_recipe_no_scale_unchanged(client: TestClient, db):
-    """Test that omitting scale parameter returns original quantities."""
-    headers = get_auth_headers(client, db)
 
-    recipe_data = {
-        "core": {"name": "Default Recipe"},
-        "times": {},
-        "nutrition": {},
-        "components": [
-            {
-                "name": "Main",
-                "ingredients": [
-                    {"ingredient_name": "Pepper", "quantity": 0.25, "unit": "tsp"},
-                ],
-            }
-        ],
-        "instructions": [],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
+# --- Ingredient Scaling Tests ---
 
-    response = client.get(f"/recipes/{recipe_id}", headers=headers)
+SCALING_RECIPE = {
+    "core": {"name": "Scaled Recipe", "yield_amount": 4, "difficulty": "Medium"},
+    "times": {"prep_time_minutes": 30, "cook_time_minutes": 45},
+    "nutrition": {"calories": 500},
+    "components": [
+        {
+            "name": "Dough",
+            "ingredients": [
+                {"ingredient_name": "Scaling Flour", "quantity": 2.0, "unit": "cups"},
+                {"ingredient_name": "Scaling Sugar", "quantity": 0.5, "unit": "cups"},
+            ],
+        },
+        {
+            "name": "Filling",
+            "ingredients": [
+                {
+                    "ingredient_name": "Scaling Onion",
+                    "quantity": 1.5,
+                    "unit": "whole",
+                    "notes": "diced",
+                },
+            ],
+        },
+    ],
+    "instructions": [{"step_number": 1, "text": "Dice the onion"}],
+    "suitable_for_diet": ["vegan"],
+}
+
+
+@pytest.fixture(scope="module")
+def scaling_recipe_id(auth_client: TestClient):
+    with committed_recipe(auth_client, SCALING_RECIPE) as recipe:
+        yield recipe["core"]["id"]
+
+
+def _quantities(data):
+    return [
+        [ingredient["quantity"] for ingredient in component["ingredients"]]
+        for component in data["components"]
+    ]
+
+
+@pytest.mark.parametrize(
+    "scale,expected_quantities,expected_yield",
+    [
+        # Double, and across multiple components
+        (2, [[4.0, 1.0], [3.0]], 8),
+        (3, [[6.0, 1.5], [4.5]], 12),
+        (0.5, [[1.0, 0.25], [0.75]], 2),
+        # scale=1 and no scale leave quantities unchanged
+        (1, [[2.0, 0.5], [1.5]], 4),
+        (None, [[2.0, 0.5], [1.5]], 4),
+        (100, [[200.0, 50.0], [150.0]], 400),
+    ],
+)
+def test_read_recipe_with_scale(
+    auth_client: TestClient,
+    db,
+    scaling_recipe_id,
+    scale,
+    expected_quantities,
+    expected_yield,
+):
+    """Test that scale multiplies ingredient quantities and yield_amount."""
+    params = {} if scale is None else {"scale": scale}
+    response = auth_client.get(f"/recipes/{scaling_recipe_id}", params=params)
     assert response.status_code == 200
     data = response.json()
 
-    assert data["components"][0]["ingredients"][0]["quantity"] == 0.25
+    assert _quantities(data) == expected_quantities
+    assert data["core"]["yield_amount"] == expected_yield
 
 
-def test_read_recipe_scale_zero_rejected(client: TestClient, db):
-    """Test that scale=0 is rejected with 422."""
-    headers = get_auth_headers(client, db)
-
-    recipe_data = {
-        "core": {"name": "Zero Scale Recipe"},
-        "times": {},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
-
-    response = client.get(f"/recipes/{recipe_id}?scale=0", headers=headers)
-    assert response.status_code == 422
-
-
-def test_read_recipe_scale_negative_rejected(client: TestClient, db):
-    """Test that negative scale values are rejected with 422."""
-    headers = get_auth_headers(client, db)
-
-    recipe_data = {
-        "core": {"name": "Negative Scale Recipe"},
-        "times": {},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
-
-    response = client.get(f"/recipes/{recipe_id}?scale=-1", headers=headers)
+@pytest.mark.parametrize("scale", [0, -1])
+def test_read_recipe_scale_non_positive_rejected(
+    auth_client: TestClient, db, scaling_recipe_id, scale
+):
+    """Test that zero and negative scale values are rejected with 422."""
+    response = auth_client.get(f"/recipes/{scaling_recipe_id}", params={"scale": scale})
     assert response.status_code == 422
 
 
-def test_read_recipe_scale_large_value(client: TestClient, db):
-    """Test that large scale values work correctly."""
-    headers = get_auth_headers(client, db)
-
-    recipe_data = {
-        "core": {"name": "Large Scale Recipe"},
-        "times": {},
-        "nutrition": {},
-        "components": [
-            {
-                "name": "Main",
-                "ingredients": [
-                    {"ingredient_name": "Water", "quantity": 1.0, "unit": "cup"},
-                ],
-            }
-        ],
-        "instructions": [],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
-
-    response = client.get(f"/recipes/{recipe_id}?scale=100", headers=headers)
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["components"][0]["ingredients"][0]["quantity"] == 100.0
-
-
-def test_read_recipe_scale_multiple_components(client: TestClient, db):
-    """Test scaling works across multiple components."""
-    headers = get_auth_headers(client, db)
-
-    recipe_data = {
-        "core": {"name": "Multi-Component Recipe"},
-        "times": {},
-        "nutrition": {},
-        "components": [
-            {
-                "name": "Dough",
-                "ingredients": [
-                    {"ingredient_name": "Flour", "quantity": 3.0, "unit": "cups"},
-                ],
-            },
-            {
-                "name": "Filling",
-                "ingredients": [
-                    {"ingredient_name": "Cheese", "quantity": 2.0, "unit": "cups"},
-                    {"ingredient_name": "Spinach", "quantity": 1.0, "unit": "cup"},
-                ],
-            },
-        ],
-        "instructions": [],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
-
-    response = client.get(f"/recipes/{recipe_id}?scale=3", headers=headers)
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["components"][0]["ingredients"][0]["quantity"] == 9.0
-    assert data["components"][1]["ingredients"][0]["quantity"] == 6.0
-    assert data["components"][1]["ingredients"][1]["quantity"] == 3.0
-
-
-def test_read_recipe_scale_preserves_other_fields(client: TestClient, db):
+def test_read_recipe_scale_preserves_other_fields(
+    auth_client: TestClient, db, scaling_recipe_id
+):
     """Test that scaling preserves non-quantity fields."""
-    headers = get_auth_headers(client, db)
-
-    recipe_data = {
-        "core": {"name": "Preserved Fields Recipe", "difficulty": "Medium"},
-        "times": {"prep_time_minutes": 30, "cook_time_minutes": 45},
-        "nutrition": {"calories": 500},
-        "components": [
-            {
-                "name": "Main",
-                "ingredients": [
-                    {
-                        "ingredient_name": "Onion",
-                        "quantity": 1.0,
-                        "unit": "whole",
-                        "notes": "diced",
-                    },
-                ],
-            }
-        ],
-        "instructions": [{"step_number": 1, "text": "Dice the onion"}],
-        "suitable_for_diet": ["vegan"],
-    }
-    create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-    recipe_id = create_res.json()["core"]["id"]
-
-    response = client.get(f"/recipes/{recipe_id}?scale=2", headers=headers)
+    response = auth_client.get(f"/recipes/{scaling_recipe_id}?scale=2")
     assert response.status_code == 200
     data = response.json()
 
+    onion = data["components"][1]["ingredients"][0]
+
     # Quantity is scaled
-    assert data["components"][0]["ingredients"][0]["quantity"] == 2.0
+    assert onion["quantity"] == 3.0
 
     # Other fields are preserved
-    assert data["components"][0]["ingredients"][0]["unit"] == "whole"
-    assert data["components"][0]["ingredients"][0]["notes"] == "diced"
-    assert data["components"][0]["ingredients"][0]["item"] == "Onion"
+    assert onion["unit"] == "whole"
+    assert onion["notes"] == "diced"
+    assert onion["item"] == "Scaling Onion"
     assert data["core"]["difficulty"] == "Medium"
     assert data["times"]["prep_time_minutes"] == 30  # Not scaled
     assert data["nutrition"]["calories"] == 500  # Not scaled
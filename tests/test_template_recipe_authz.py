@@ -17,70 +17,57 @@ Recipes (Shared Read):
 - Comment ownership rules mirror the same pattern (author or admin mode).
 """
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app import crud, schemas, models
+from app import models
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-
-def create_user_and_login(
-    client: TestClient,
-    db: Session,
-    email: str,
-    password: str = "password",
-    is_admin: bool = False,
-):
-    """Create a user (if not exists), set admin flag if needed, return (user, headers)."""
-    try:
-        user_in = schemas.UserCreate(email=email, password=password)
-        user = crud.create_user(db, user_in)
-    except Exception:
-        user = crud.get_user_by_email(db, email=email)
-
-    if is_admin and not user.is_admin:
-        user.is_admin = True
-        db.add(user)
-        db.commit()
-
-    response = client.post(
-        "/auth/token",
-        data={"username": email, "password": password},
-    )
-    assert response.status_code == 200, f"Login failed for {email}: {response.json()}"
-    token = response.json()["access_token"]
-    return user, {"Authorization": f"Bearer {token}"}
-
-
-def create_recipe_via_api(
-    client: TestClient, headers: dict, name: str = "Test Recipe"
-) -> dict:
-    """Create a recipe via the API and return the response JSON."""
-    recipe_data = {
-        "core": {"name": name},
-        "times": {},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    response = client.post("/recipes/", json=recipe_data, headers=headers)
-    assert response.status_code == 201, f"Recipe creation failed: {response.json()}"
-    return response.json()
+# Every section of a recipe update body except "core", left empty.
+_EMPTY_RECIPE_BODY = {
+    "times": {},
+    "nutrition": {},
+    "components": [],
+    "instructions": [],
+}
 
 
-def create_recipe_direct(db: Session, user_id, name: str) -> models.Recipe:
-    """Create a recipe directly in the DB."""
-    recipe = models.Recipe(
+def build_recipe(user_id, name: str) -> models.Recipe:
+    """Build an unsaved recipe owned by ``user_id``."""
+    return models.Recipe(
         name=name,
         owner_id=user_id,
         description="Test description",
         instructions=[],
         components=[],
     )
+
+
+def build_comment(user_id, recipe: models.Recipe, text: str) -> models.Comment:
+    """Build an unsaved comment on ``recipe``; its id is resolved on flush."""
+    return models.Comment(user_id=user_id, recipe=recipe, text=text)
+
+
+def create_recipe_with_comment(
+    db: Session, user_id, recipe_name: str, comment_text: str
+) -> tuple[models.Recipe, models.Comment]:
+    """Create a recipe and a comment on it with a single flush."""
+    recipe = build_recipe(user_id, recipe_name)
+    comment = build_comment(user_id, recipe, comment_text)
+    db.add_all([recipe, comment])
+    # uuid4 column defaults fill both ids on flush; no refresh SELECT needed.
+    db.flush()
+    return recipe, comment
+
+
+def create_recipe_direct(db: Session, user_id, name: str) -> models.Recipe:
+    """Create a recipe directly in the DB."""
+    recipe = build_recipe(user_id, name)
     db.add(recipe)
     db.commit()
     db.refresh(recipe)
@@ -100,19 +87,15 @@ def create_template_direct(db: Session, user_id, name: str) -> models.MealTempla
     return template
 
 
-def create_comment_direct(
-    db: Session, user_id, recipe_id, text: str = "A comment"
-) -> models.Comment:
-    """Create a comment directly in the DB."""
-    comment = models.Comment(
-        user_id=user_id,
-        recipe_id=recipe_id,
-        text=text,
-    )
-    db.add(comment)
-    db.commit()
-    db.refresh(comment)
-    return comment
+# (actor, admin_mode, allowed) for every update/delete below. The resource
+# always belongs to the "owner" user; admins only bypass ownership checks when
+# they send X-Admin-Mode: true.
+PERMISSION_CASES = [
+    pytest.param("other", False, False, id="non-owner"),
+    pytest.param("owner", False, True, id="owner"),
+    pytest.param("admin", True, True, id="admin-mode"),
+    pytest.param("admin", False, False, id="admin-without-admin-mode"),
+]
 
 
 # ===========================================================================
@@ -125,22 +108,26 @@ def create_comment_direct(
 # ---------------------------------------------------------------------------
 
 
-def test_get_templates_any_user_can_list_all(client: TestClient, db: Session):
+def test_get_templates_any_user_can_list_all(
+    client: TestClient, db: Session, permission_actors
+):
     """GET /meals/templates — any authenticated user can see all templates."""
-    owner, owner_headers = create_user_and_login(
-        client, db, "tpl_list_owner@example.com"
-    )
-    other, other_headers = create_user_and_login(
-        client, db, "tpl_list_other@example.com"
-    )
+    owner = permission_actors.owner
+    other_headers = permission_actors.other.headers
 
     template = create_template_direct(db, owner.id, "Owner Template For List")
 
-    # The 'other' user (non-owner) should be able to list and see the template
-    response = client.get("/meals/templates", headers=other_headers)
+    # The 'other' user (non-owner) should be able to list and see the template.
+    # Filtering to the owner keeps the listing small however much data other
+    # tests have committed, without narrowing it to the caller's own templates.
+    response = client.get(
+        "/meals/templates",
+        params={"owner[eq]": str(owner.id)},
+        headers=other_headers,
+    )
     assert response.status_code == 200
 
-    template_ids = [t["id"] for t in response.json()]
+    template_ids = {t["id"] for t in response.json()}
     assert str(template.id) in template_ids, "Non-owner should see all templates"
 
 
@@ -149,14 +136,12 @@ def test_get_templates_any_user_can_list_all(client: TestClient, db: Session):
 # ---------------------------------------------------------------------------
 
 
-def test_get_template_by_id_non_owner_can_view(client: TestClient, db: Session):
+def test_get_template_by_id_non_owner_can_view(
+    client: TestClient, db: Session, permission_actors
+):
     """GET /meals/templates/{id} — non-owner can view any template."""
-    owner, owner_headers = create_user_and_login(
-        client, db, "tpl_get_owner@example.com"
-    )
-    other, other_headers = create_user_and_login(
-        client, db, "tpl_get_other@example.com"
-    )
+    owner = permission_actors.owner
+    other_headers = permission_actors.other.headers
 
     template = create_template_direct(db, owner.id, "Owner Template For Get")
 
@@ -170,80 +155,23 @@ def test_get_template_by_id_non_owner_can_view(client: TestClient, db: Session):
 # ---------------------------------------------------------------------------
 
 
-def test_put_template_non_owner_gets_403(client: TestClient, db: Session):
-    """PUT /meals/templates/{id} — non-owner gets 403."""
-    owner, owner_headers = create_user_and_login(
-        client, db, "tpl_put403_owner@example.com"
-    )
-    other, other_headers = create_user_and_login(
-        client, db, "tpl_put403_other@example.com"
-    )
-
-    template = create_template_direct(db, owner.id, "Owner Template For Put")
-
-    response = client.put(
-        f"/meals/templates/{template.id}",
-        json={"name": "Hacked Template"},
-        headers=other_headers,
-    )
-    assert response.status_code == 403
-
-
-def test_put_template_owner_succeeds(client: TestClient, db: Session):
-    """PUT /meals/templates/{id} — owner can update their template."""
-    owner, owner_headers = create_user_and_login(
-        client, db, "tpl_put_owner@example.com"
-    )
-
-    template = create_template_direct(db, owner.id, "Owner Template To Update")
-
-    response = client.put(
-        f"/meals/templates/{template.id}",
-        json={"name": "Updated Template Name"},
-        headers=owner_headers,
-    )
-    assert response.status_code == 200
-    assert response.json()["name"] == "Updated Template Name"
-
-
-def test_put_template_admin_mode_succeeds(client: TestClient, db: Session):
-    """PUT /meals/templates/{id} with X-Admin-Mode: true — admin can update any template."""
-    owner, _ = create_user_and_login(client, db, "tpl_putadmin_owner@example.com")
-    admin, admin_base_headers = create_user_and_login(
-        client, db, "tpl_putadmin_admin@example.com", is_admin=True
-    )
-    admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
-
-    template = create_template_direct(db, owner.id, "Template For Admin Update")
-
-    response = client.put(
-        f"/meals/templates/{template.id}",
-        json={"name": "Admin Updated Template"},
-        headers=admin_headers,
-    )
-    assert response.status_code == 200
-    assert response.json()["name"] == "Admin Updated Template"
-
-
-def test_put_template_admin_without_admin_mode_gets_403(
-    client: TestClient, db: Session
+@pytest.mark.parametrize("actor,admin_mode,allowed", PERMISSION_CASES)
+def test_put_template_permissions(
+    client: TestClient, db: Session, permission_actors, actor, admin_mode, allowed
 ):
-    """PUT /meals/templates/{id} — admin without X-Admin-Mode header is subject to ownership check."""
-    owner, _ = create_user_and_login(
-        client, db, "tpl_putadmin_nomode_owner@example.com"
+    """PUT /meals/templates/{id} — only the owner or an admin in admin mode may update."""
+    template = create_template_direct(
+        db, permission_actors.owner.id, "Template For Put"
     )
-    admin, admin_headers = create_user_and_login(
-        client, db, "tpl_putadmin_nomode_admin@example.com", is_admin=True
-    )
-    # No X-Admin-Mode header — admin operates in user mode, subject to ownership checks
-    template = create_template_direct(db, owner.id, "Template For Admin No-Mode Update")
 
     response = client.put(
         f"/meals/templates/{template.id}",
-        json={"name": "Should Fail"},
-        headers=admin_headers,
+        json={"name": "Updated Template Name"},
+        headers=permission_actors.headers_for(actor, admin_mode),
     )
-    assert response.status_code == 403
+    assert response.status_code == (200 if allowed else 403)
+    if allowed:
+        assert response.json()["name"] == "Updated Template Name"
 
 
 # ---------------------------------------------------------------------------
@@ -251,66 +179,24 @@ def test_put_template_admin_without_admin_mode_gets_403(
 # ---------------------------------------------------------------------------
 
 
-def test_delete_template_non_owner_gets_403(client: TestClient, db: Session):
-    """DELETE /meals/templates/{id} — non-owner gets 403."""
-    owner, owner_headers = create_user_and_login(
-        client, db, "tpl_del403_owner@example.com"
-    )
-    other, other_headers = create_user_and_login(
-        client, db, "tpl_del403_other@example.com"
-    )
-
-    template = create_template_direct(db, owner.id, "Owner Template For Delete Reject")
-
-    response = client.delete(f"/meals/templates/{template.id}", headers=other_headers)
-    assert response.status_code == 403
-
-
-def test_delete_template_owner_succeeds(client: TestClient, db: Session):
-    """DELETE /meals/templates/{id} — owner can delete their template."""
-    owner, owner_headers = create_user_and_login(
-        client, db, "tpl_del_owner@example.com"
-    )
-
-    template = create_template_direct(db, owner.id, "Owner Template To Delete")
-
-    response = client.delete(f"/meals/templates/{template.id}", headers=owner_headers)
-    assert response.status_code == 204
-
-
-def test_delete_template_admin_mode_succeeds(client: TestClient, db: Session):
-    """DELETE /meals/templates/{id} with X-Admin-Mode: true — admin can delete any template."""
-    owner, _ = create_user_and_login(client, db, "tpl_deladmin_owner@example.com")
-    admin, admin_base_headers = create_user_and_login(
-        client, db, "tpl_deladmin_admin@example.com", is_admin=True
-    )
-    admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
-
-    template = create_template_direct(db, owner.id, "Template For Admin Delete")
-
-    response = client.delete(f"/meals/templates/{template.id}", headers=admin_headers)
-    assert response.status_code == 204
-
-    # Confirm it's gone (admin can still check)
-    get_response = client.get(f"/meals/templates/{template.id}", headers=admin_headers)
-    assert get_response.status_code == 404
-
-
-def test_delete_template_admin_without_admin_mode_gets_403(
-    client: TestClient, db: Session
+@pytest.mark.parametrize("actor,admin_mode,allowed", PERMISSION_CASES)
+def test_delete_template_permissions(
+    client: TestClient, db: Session, permission_actors, actor, admin_mode, allowed
 ):
-    """DELETE /meals/templates/{id} — admin without X-Admin-Mode header is subject to ownership check."""
-    owner, _ = create_user_and_login(
-        client, db, "tpl_deladmin_nomode_owner@example.com"
+    """DELETE /meals/templates/{id} — only the owner or an admin in admin mode may delete."""
+    template = create_template_direct(
+        db, permission_actors.owner.id, "Template For Delete"
     )
-    admin, admin_headers = create_user_and_login(
-        client, db, "tpl_deladmin_nomode_admin@example.com", is_admin=True
+
+    response = client.delete(
+        f"/meals/templates/{template.id}",
+        headers=permission_actors.headers_for(actor, admin_mode),
     )
-    # No X-Admin-Mode header — admin operates in user mode, subject to ownership checks
-    template = create_template_direct(db, owner.id, "Template For Admin No-Mode Delete")
+    assert response.status_code == (204 if allowed else 403)
 
-    response = client.delete(f"/meals/templates/{template.id}", headers=admin_headers)
-    assert response.status_code == 403
+    # Check the row itself; the non-allowed cases must leave it in place.
+    db.expire_all()
+    assert (db.get(models.MealTemplate, template.id) is None) == allowed
 
 
 # ===========================================================================
@@ -323,19 +209,21 @@ def test_delete_template_admin_without_admin_mode_gets_403(
 # ---------------------------------------------------------------------------
 
 
-def test_get_recipes_any_user_can_list_all(client: TestClient, db: Session):
+def test_get_recipes_any_user_can_list_all(
+    client: TestClient, db: Session, permission_actors
+):
     """GET /recipes — any authenticated user can see all recipes."""
-    owner, _ = create_user_and_login(client, db, "rcp_list_owner@example.com")
-    other, other_headers = create_user_and_login(
-        client, db, "rcp_list_other@example.com"
-    )
+    owner = permission_actors.owner
+    other_headers = permission_actors.other.headers
 
     recipe = create_recipe_direct(db, owner.id, "Owner Recipe For List")
 
-    response = client.get("/recipes/", headers=other_headers)
+    response = client.get(
+        "/recipes/", params={"owner[eq]": owner.email}, headers=other_headers
+    )
     assert response.status_code == 200
 
-    recipe_ids = [r["core"]["id"] for r in response.json()]
+    recipe_ids = {r["core"]["id"] for r in response.json()}
     assert str(recipe.id) in recipe_ids, "Non-owner should see all recipes"
 
 
@@ -344,12 +232,12 @@ def test_get_recipes_any_user_can_list_all(client: TestClient, db: Session):
 # ---------------------------------------------------------------------------
 
 
-def test_get_recipe_by_id_non_owner_can_view(client: TestClient, db: Session):
+def test_get_recipe_by_id_non_owner_can_view(
+    client: TestClient, db: Session, permission_actors
+):
     """GET /recipes/{id} — non-owner can view any recipe."""
-    owner, _ = create_user_and_login(client, db, "rcp_get_owner@example.com")
-    other, other_headers = create_user_and_login(
-        client, db, "rcp_get_other@example.com"
-    )
+    owner = permission_actors.owner
+    other_headers = permission_actors.other.headers
 
     recipe = create_recipe_direct(db, owner.id, "Owner Recipe For Get")
 
@@ -363,96 +251,22 @@ def test_get_recipe_by_id_non_owner_can_view(client: TestClient, db: Session):
 # ---------------------------------------------------------------------------
 
 
-def test_put_recipe_non_owner_gets_403(client: TestClient, db: Session):
-    """PUT /recipes/{id} — non-owner gets 403."""
-    owner, _ = create_user_and_login(client, db, "rcp_put403_owner@example.com")
-    other, other_headers = create_user_and_login(
-        client, db, "rcp_put403_other@example.com"
-    )
-
-    recipe = create_recipe_direct(db, owner.id, "Owner Recipe For Put Reject")
-
-    update_data = {
-        "core": {"name": "Hacked Recipe"},
-        "times": {},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    response = client.put(
-        f"/recipes/{recipe.id}", json=update_data, headers=other_headers
-    )
-    assert response.status_code == 403
-
-
-def test_put_recipe_owner_succeeds(client: TestClient, db: Session):
-    """PUT /recipes/{id} — owner can update their recipe."""
-    owner, owner_headers = create_user_and_login(
-        client, db, "rcp_put_owner@example.com"
-    )
-
-    recipe = create_recipe_direct(db, owner.id, "Owner Recipe To Update")
-
-    update_data = {
-        "core": {"name": "Updated Recipe Name"},
-        "times": {},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    response = client.put(
-        f"/recipes/{recipe.id}", json=update_data, headers=owner_headers
-    )
-    assert response.status_code == 200
-    assert response.json()["core"]["name"] == "Updated Recipe Name"
-
-
-def test_put_recipe_admin_mode_succeeds(client: TestClient, db: Session):
-    """PUT /recipes/{id} with X-Admin-Mode: true — admin can update any recipe."""
-    owner, _ = create_user_and_login(client, db, "rcp_putadmin_owner@example.com")
-    admin, admin_base_headers = create_user_and_login(
-        client, db, "rcp_putadmin_admin@example.com", is_admin=True
-    )
-    admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
-
-    recipe = create_recipe_direct(db, owner.id, "Recipe For Admin Update")
-
-    update_data = {
-        "core": {"name": "Admin Updated Recipe"},
-        "times": {},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
-    response = client.put(
-        f"/recipes/{recipe.id}", json=update_data, headers=admin_headers
-    )
-    assert response.status_code == 200
-    assert response.json()["core"]["name"] == "Admin Updated Recipe"
-
+@pytest.mark.parametrize("actor,admin_mode,allowed", PERMISSION_CASES)
+def test_put_recipe_permissions(
+    client: TestClient, db: Session, permission_actors, actor, admin_mode, allowed
+):
+    """PUT /recipes/{id} — only the owner or an admin in admin mode may update."""
+    recipe = create_recipe_direct(db, permission_actors.owner.id, "Recipe For Put")
 
-def test_put_recipe_admin_without_admin_mode_gets_403(client: TestClient, db: Session):
-    """PUT /recipes/{id} — admin without X-Admin-Mode header is subject to ownership check."""
-    owner, _ = create_user_and_login(
-        client, db, "rcp_putadmin_nomode_owner@example.com"
-    )
-    admin, admin_headers = create_user_and_login(
-        client, db, "rcp_putadmin_nomode_admin@example.com", is_admin=True
-    )
-    # No X-Admin-Mode header — admin operates in user mode, subject to ownership checks
-    recipe = create_recipe_direct(db, owner.id, "Recipe For Admin No-Mode Update")
-
-    update_data = {
-        "core": {"name": "Should Fail"},
-        "times": {},
-        "nutrition": {},
-        "components": [],
-        "instructions": [],
-    }
+    update_data = {"core": {"name": "Updated Recipe Name"}, **_EMPTY_RECIPE_BODY}
     response = client.put(
-        f"/recipes/{recipe.id}", json=update_data, headers=admin_headers
+        f"/recipes/{recipe.id}",
+        json=update_data,
+        headers=permission_actors.headers_for(actor, admin_mode),
     )
-    assert response.status_code == 403
+    assert response.status_code == (200 if allowed else 403)
+    if allowed:
+        assert response.json()["core"]["name"] == "Updated Recipe Name"
 
 
 # ---------------------------------------------------------------------------
@@ -460,64 +274,21 @@ def test_put_recipe_admin_without_admin_mode_gets_403(client: TestClient, db: Se
 # ---------------------------------------------------------------------------
 
 
-def test_delete_recipe_non_owner_gets_403(client: TestClient, db: Session):
-    """DELETE /recipes/{id} — non-owner gets 403."""
-    owner, _ = create_user_and_login(client, db, "rcp_del403_owner@example.com")
-    other, other_headers = create_user_and_login(
-        client, db, "rcp_del403_other@example.com"
-    )
-
-    recipe = create_recipe_direct(db, owner.id, "Owner Recipe For Delete Reject")
-
-    response = client.delete(f"/recipes/{recipe.id}", headers=other_headers)
-    assert response.status_code == 403
-
-
-def test_delete_recipe_owner_succeeds(client: TestClient, db: Session):
-    """DELETE /recipes/{id} — owner can delete their recipe."""
-    owner, owner_headers = create_user_and_login(
-        client, db, "rcp_del_owner@example.com"
-    )
-
-    recipe = create_recipe_direct(db, owner.id, "Owner Recipe To Delete")
-
-    response = client.delete(f"/recipes/{recipe.id}", headers=owner_headers)
-    assert response.status_code == 200
-
-
-def test_delete_recipe_admin_mode_succeeds(client: TestClient, db: Session):
-    """DELETE /recipes/{id} with X-Admin-Mode: true — admin can delete any recipe."""
-    owner, _ = create_user_and_login(client, db, "rcp_deladmin_owner@example.com")
-    admin, admin_base_headers = create_user_and_login(
-        client, db, "rcp_deladmin_admin@example.com", is_admin=True
-    )
-    admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
-
-    recipe = create_recipe_direct(db, owner.id, "Recipe For Admin Delete")
-
-    response = client.delete(f"/recipes/{recipe.id}", headers=admin_headers)
-    assert response.status_code == 200
-
-    # Confirm it's gone
-    get_response = client.get(f"/recipes/{recipe.id}", headers=admin_headers)
-    assert get_response.status_code == 404
-
-
-def test_delete_recipe_admin_without_admin_mode_gets_403(
-    client: TestClient, db: Session
+@pytest.mark.parametrize("actor,admin_mode,allowed", PERMISSION_CASES)
+def test_delete_recipe_permissions(
+    client: TestClient, db: Session, permission_actors, actor, admin_mode, allowed
 ):
-    """DELETE /recipes/{id} — admin without X-Admin-Mode header is subject to ownership check."""
-    owner, _ = create_user_and_login(
-        client, db, "rcp_deladmin_nomode_owner@example.com"
-    )
-    admin, admin_headers = create_user_and_login(
-        client, db, "rcp_deladmin_nomode_admin@example.com", is_admin=True
+    """DELETE /recipes/{id} — only the owner or an admin in admin mode may delete."""
+    recipe = create_recipe_direct(db, permission_actors.owner.id, "Recipe For Delete")
+
+    response = client.delete(
+        f"/recipes/{recipe.id}",
+        headers=permission_actors.headers_for(actor, admin_mode),
     )
-    # No X-Admin-Mode header — admin operates in user mode, subject to ownership checks
-    recipe = create_recipe_direct(db, owner.id, "Recipe For Admin No-Mode Delete")
+    assert response.status_code == (200 if allowed else 403)
 
-    response = client.delete(f"/recipes/{recipe.id}", headers=admin_headers)
-    assert response.status_code == 403
+    db.expire_all()
+    assert (db.get(models.Recipe, recipe.id) is None) == allowed
 
 
 # ===========================================================================
@@ -530,86 +301,23 @@ def test_delete_recipe_admin_without_admin_mode_gets_403(
 # ---------------------------------------------------------------------------
 
 
-def test_put_comment_non_author_gets_403(client: TestClient, db: Session):
-    """PUT comment — non-author gets 403."""
-    author, author_headers = create_user_and_login(
-        client, db, "cmt_put403_author@example.com"
-    )
-    other, other_headers = create_user_and_login(
-        client, db, "cmt_put403_other@example.com"
-    )
-
-    recipe = create_recipe_direct(db, author.id, "Recipe For Comment Put Reject")
-    comment = create_comment_direct(db, author.id, recipe.id, "Author comment text")
-
-    response = client.put(
-        f"/recipes/{recipe.id}/comments/{comment.id}",
-        json={"text": "Hacked comment"},
-        headers=other_headers,
-    )
-    assert response.status_code == 403
-
-
-def test_put_comment_author_succeeds(client: TestClient, db: Session):
-    """PUT comment — author can update their own comment."""
-    author, author_headers = create_user_and_login(
-        client, db, "cmt_put_author@example.com"
+@pytest.mark.parametrize("actor,admin_mode,allowed", PERMISSION_CASES)
+def test_put_comment_permissions(
+    client: TestClient, db: Session, permission_actors, actor, admin_mode, allowed
+):
+    """PUT comment — only the author or an admin in admin mode may update."""
+    recipe, comment = create_recipe_with_comment(
+        db, permission_actors.owner.id, "Recipe For Comment Put", "Original comment"
     )
 
-    recipe = create_recipe_direct(db, author.id, "Recipe For Comment Put")
-    comment = create_comment_direct(db, author.id, recipe.id, "Original comment")
-
     response = client.put(
         f"/recipes/{recipe.id}/comments/{comment.id}",
         json={"text": "Updated comment text"},
-        headers=author_headers,
-    )
-    assert response.status_code == 200
-    assert response.json()["text"] == "Updated comment text"
-
-
-def test_put_comment_admin_mode_succeeds(client: TestClient, db: Session):
-    """PUT comment with X-Admin-Mode: true — admin can update any comment."""
-    author, _ = create_user_and_login(client, db, "cmt_putadmin_author@example.com")
-    admin, admin_base_headers = create_user_and_login(
-        client, db, "cmt_putadmin_admin@example.com", is_admin=True
-    )
-    admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
-
-    recipe = create_recipe_direct(db, author.id, "Recipe For Admin Comment Update")
-    comment = create_comment_direct(db, author.id, recipe.id, "Comment for admin")
-
-    response = client.put(
-        f"/recipes/{recipe.id}/comments/{comment.id}",
-        json={"text": "Admin updated comment"},
-        headers=admin_headers,
+        headers=permission_actors.headers_for(actor, admin_mode),
     )
-    assert response.status_code == 200
-    assert response.json()["text"] == "Admin updated comment"
-
-
-def test_put_comment_admin_without_admin_mode_gets_403(client: TestClient, db: Session):
-    """PUT comment — admin without X-Admin-Mode header is subject to authorship check."""
-    author, _ = create_user_and_login(
-        client, db, "cmt_putadmin_nomode_author@example.com"
-    )
-    admin, admin_headers = create_user_and_login(
-        client, db, "cmt_putadmin_nomode_admin@example.com", is_admin=True
-    )
-    # No X-Admin-Mode header — admin operates in user mode, subject to authorship checks
-    recipe = create_recipe_direct(
-        db, author.id, "Recipe For Admin No-Mode Comment Update"
-    )
-    comment = create_comment_direct(
-        db, author.id, recipe.id, "Comment for admin no-mode"
-    )
-
-    response = client.put(
-        f"/recipes/{recipe.id}/comments/{comment.id}",
-        json={"text": "Should fail"},
-        headers=admin_headers,
-    )
-    assert response.status_code == 403
+    assert response.status_code == (200 if allowed else 403)
+    if allowed:
+        assert response.json()["text"] == "Updated comment text"
 
 
 # ---------------------------------------------------------------------------
@@ -617,77 +325,17 @@ def test_put_comment_admin_without_admin_mode_gets_403(client: TestClient, db: S
 # ---------------------------------------------------------------------------
 
 
-def test_delete_comment_non_author_gets_403(client: TestClient, db: Session):
-    """DELETE comment — non-author gets 403."""
-    author, _ = create_user_and_login(client, db, "cmt_del403_author@example.com")
-    other, other_headers = create_user_and_login(
-        client, db, "cmt_del403_other@example.com"
-    )
-
-    recipe = create_recipe_direct(db, author.id, "Recipe For Comment Delete Reject")
-    comment = create_comment_direct(
-        db, author.id, recipe.id, "Author comment for delete"
-    )
-
-    response = client.delete(
-        f"/recipes/{recipe.id}/comments/{comment.id}", headers=other_headers
-    )
-    assert response.status_code == 403
-
-
-def test_delete_comment_author_succeeds(client: TestClient, db: Session):
-    """DELETE comment — author can delete their own comment."""
-    author, author_headers = create_user_and_login(
-        client, db, "cmt_del_author@example.com"
-    )
-
-    recipe = create_recipe_direct(db, author.id, "Recipe For Comment Delete")
-    comment = create_comment_direct(db, author.id, recipe.id, "Comment to delete")
-
-    response = client.delete(
-        f"/recipes/{recipe.id}/comments/{comment.id}", headers=author_headers
-    )
-    assert response.status_code == 204
-
-
-def test_delete_comment_admin_mode_succeeds(client: TestClient, db: Session):
-    """DELETE comment with X-Admin-Mode: true — admin can delete any comment."""
-    author, _ = create_user_and_login(client, db, "cmt_deladmin_author@example.com")
-    admin, admin_base_headers = create_user_and_login(
-        client, db, "cmt_deladmin_admin@example.com", is_admin=True
-    )
-    admin_headers = {**admin_base_headers, "X-Admin-Mode": "true"}
-
-    recipe = create_recipe_direct(db, author.id, "Recipe For Admin Comment Delete")
-    comment = create_comment_direct(
-        db, author.id, recipe.id, "Comment for admin to delete"
-    )
-
-    response = client.delete(
-        f"/recipes/{recipe.id}/comments/{comment.id}", headers=admin_headers
-    )
-    assert response.status_code == 204
-
-
-def test_delete_comment_admin_without_admin_mode_gets_403(
-    client: TestClient, db: Session
+@pytest.mark.parametrize("actor,admin_mode,allowed", PERMISSION_CASES)
+def test_delete_comment_permissions(
+    client: TestClient, db: Session, permission_actors, actor, admin_mode, allowed
 ):
-    """DELETE comment — admin without X-Admin-Mode header is subject to authorship check."""
-    author, _ = create_user_and_login(
-        client, db, "cmt_deladmin_nomode_author@example.com"
-    )
-    admin, admin_headers = create_user_and_login(
-        client, db, "cmt_deladmin_nomode_admin@example.com", is_admin=True
-    )
-    # No X-Admin-Mode header — admin operates in user mode, subject to authorship checks
-    recipe = create_recipe_direct(
-        db, author.id, "Recipe For Admin No-Mode Comment Delete"
-    )
-    comment = create_comment_direct(
-        db, author.id, recipe.id, "Comment for admin no-mode delete"
+    """DELETE comment — only the author or an admin in admin mode may delete."""
+    recipe, comment = create_recipe_with_comment(
+        db, permission_actors.owner.id, "Recipe For Comment Delete", "Comment to delete"
     )
 
     response = client.delete(
-        f"/recipes/{recipe.id}/comments/{comment.id}", headers=admin_headers
+        f"/recipes/{recipe.id}/comments/{comment.id}",
+        headers=permission_actors.headers_for(actor, admin_mode),
     )
-    assert response.status_code == 403
+    assert response.status_code == (204 if allowed else 403)
@@ -1,8 +1,8 @@
 """Tests for metric/imperial unit conversion functionality."""
 
+import pytest
 from fastapi.testclient import TestClient
 
-from app import crud, schemas
 from app.unit_conversion import (
     UnitSystem,
     get_unit_info,
@@ -10,6 +10,7 @@ from app.unit_conversion import (
     convert_quantity,
     convert_recipe_units,
 )
+from tests.helpers import committed_recipe
 
 
 # --- Unit Conversion Module Tests ---
@@ -57,6 +58,21 @@ class TestGetUnitInfo:
         assert get_unit_info("ML") == ("milliliter", UnitSystem.METRIC, "volume")
         assert get_unit_info("Gram") == ("gram", UnitSystem.METRIC, "weight")
 
+    def test_surrounding_whitespace_ignored(self):
+        """Test that padded units still resolve after the direct lookup misses."""
+        assert get_unit_info(" cups ") == ("cup", UnitSystem.IMPERIAL, "volume")
+        assert get_unit_info("Fl Oz\n") == (
+            "fluid_ounce",
+            UnitSystem.IMPERIAL,
+            "volume",
+        )
+        assert detect_recipe_unit_system([{"unit": " G "}]) == UnitSystem.METRIC
+
+    def test_aliases_share_one_info_tuple(self):
+        """Test that aliases of the same unit resolve to the same tuple object."""
+        assert get_unit_info("cup") is get_unit_info("cups")
+        assert get_unit_info("g") is get_unit_info("grams")
+
     def test_unknown_unit(self):
         """Test that unknown units return None."""
         assert get_unit_info("slice") is None
@@ -247,54 +263,100 @@ class TestConvertRecipeUnits:
         # Cups should be converted
         assert result["components"][0]["ingredients"][1]["unit"] == "ml"
 
+    def test_recipe_already_in_target_system_unchanged(self):
+        """Test that a recipe already in the target system comes back as is."""
+        ingredients = [
+            {"quantity": 2, "unit": "cups", "item": "Flour"},
+            {"quantity": 1, "unit": "slice", "item": "Bread"},
+        ]
+        recipe = {"components": [{"name": "Main", "ingredients": ingredients}]}
+        result = convert_recipe_units(recipe, UnitSystem.IMPERIAL)
 
-# --- API Endpoint Tests ---
-
-
-def get_auth_headers(
-    client: TestClient, db, email="unitconvert@example.com", password="password"
-):
-    """Helper to get authentication headers."""
-    try:
-        user_in = schemas.UserCreate(email=email, password=password)
-        crud.create_user(db, user_in)
-    except Exception:
-        pass
-
-    response = client.post(
-        "/auth/token",
-        data={"username": email, "password": password},
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-
-class TestRecipeUnitConversionAPI:
-    """Tests for the recipe API unit conversion parameter."""
-
-    def test_read_recipe_with_metric_units(self, client: TestClient, db):
-        """Test retrieving recipe with metric unit conversion."""
-        headers = get_auth_headers(client, db)
+        assert result is recipe
+        assert result["components"][0]["ingredients"] == [
+            {"quantity": 2, "unit": "cups", "item": "Flour"},
+            {"quantity": 1, "unit": "slice", "item": "Bread"},
+        ]
 
-        recipe_data = {
-            "core": {"name": "Unit Test Recipe"},
-            "times": {},
-            "nutrition": {},
+    def test_minority_units_converted_in_mostly_target_recipe(self):
+        """Test that a mostly-imperial recipe still converts its metric units."""
+        recipe = {
             "components": [
                 {
                     "name": "Main",
                     "ingredients": [
-                        {"ingredient_name": "Flour", "quantity": 2, "unit": "cups"},
-                        {"ingredient_name": "Butter", "quantity": 4, "unit": "oz"},
+                        {"quantity": 2, "unit": "cups", "item": "Flour"},
+                        {"quantity": 1, "unit": "tbsp", "item": "Oil"},
+                        {"quantity": 100, "unit": "g", "item": "Sugar"},
                     ],
                 }
+            ]
+        }
+        result = convert_recipe_units(recipe, UnitSystem.IMPERIAL)
+
+        ingredients = result["components"][0]["ingredients"]
+        assert [i["unit"] for i in ingredients] == ["cups", "tbsp", "oz"]
+        assert abs(ingredients[2]["quantity"] - 3.5) < 0.1
+
+
+# --- API Endpoint Tests ---
+
+
+IMPERIAL_RECIPE = {
+    "core": {"name": "Imperial Unit Recipe"},
+    "times": {},
+    "nutrition": {},
+    "components": [
+        {
+            "name": "Main",
+            "ingredients": [
+                {"ingredient_name": "Unit API Flour", "quantity": 2, "unit": "cups"},
+                {"ingredient_name": "Unit API Butter", "quantity": 4, "unit": "oz"},
             ],
-            "instructions": [],
         }
-        create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-        recipe_id = create_res.json()["core"]["id"]
+    ],
+    "instructions": [],
+}
+
+METRIC_RECIPE = {
+    "core": {"name": "Metric Unit Recipe"},
+    "times": {},
+    "nutrition": {},
+    "components": [
+        {
+            "name": "Main",
+            "ingredients": [
+                {"ingredient_name": "Unit API Water", "quantity": 500, "unit": "ml"},
+                {"ingredient_name": "Unit API Sugar", "quantity": 100, "unit": "g"},
+            ],
+        }
+    ],
+    "instructions": [],
+}
+
+
+@pytest.fixture(scope="class")
+def imperial_recipe_id(client: TestClient, auth_headers):
+    with committed_recipe(client, IMPERIAL_RECIPE, auth_headers) as recipe:
+        yield recipe["core"]["id"]
+
+
+@pytest.fixture(scope="class")
+def metric_recipe_id(client: TestClient, auth_headers):
+    with committed_recipe(client, METRIC_RECIPE, auth_headers) as recipe:
+        yield recipe["core"]["id"]
+
 
-        response = client.get(f"/recipes/{recipe_id}?units=metric", headers=headers)
+class TestRecipeUnitConversionAPI:
+    """Tests for the recipe API unit conversion parameter."""
+
+    def test_read_recipe_with_metric_units(
+        self, client: TestClient, db, auth_headers, imperial_recipe_id
+    ):
+        """Test retrieving recipe with metric unit conversion."""
+        response = client.get(
+            f"/recipes/{imperial_recipe_id}?units=metric", headers=auth_headers
+        )
         assert response.status_code == 200
         data = response.json()
 
@@ -311,29 +373,13 @@ class TestRecipeUnitConversionAPI:
         # unit_system should reflect the target system after conversion
         assert data["unit_system"] == "metric"
 
-    def test_read_recipe_with_imperial_units(self, client: TestClient, db):
+    def test_read_recipe_with_imperial_units(
+        self, client: TestClient, db, auth_headers, metric_recipe_id
+    ):
         """Test retrieving recipe with imperial unit conversion."""
-        headers = get_auth_headers(client, db)
-
-        recipe_data = {
-            "core": {"name": "Metric Recipe"},
-            "times": {},
-            "nutrition": {},
-            "components": [
-                {
-                    "name": "Main",
-                    "ingredients": [
-                        {"ingredient_name": "Water", "quantity": 500, "unit": "ml"},
-                        {"ingredient_name": "Sugar", "quantity": 100, "unit": "g"},
-                    ],
-                }
-            ],
-            "instructions": [],
-        }
-        create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-        recipe_id = create_res.json()["core"]["id"]
-
-        response = client.get(f"/recipes/{recipe_id}?units=imperial", headers=headers)
+        response = client.get(
+            f"/recipes/{metric_recipe_id}?units=imperial", headers=auth_headers
+        )
         assert response.status_code == 200
         data = response.json()
 
@@ -350,10 +396,8 @@ class TestRecipeUnitConversionAPI:
         # unit_system should reflect the target system after conversion
         assert data["unit_system"] == "imperial"
 
-    def test_read_recipe_no_units_parameter(self, client: TestClient, db):
+    def test_read_recipe_no_units_parameter(self, client: TestClient, db, auth_headers):
         """Test that omitting units parameter keeps original units and includes unit_system."""
-        headers = get_auth_headers(client, db)
-
         recipe_data = {
             "core": {"name": "Default Units Recipe"},
             "times": {},
@@ -368,10 +412,10 @@ class TestRecipeUnitConversionAPI:
             ],
             "instructions": [],
         }
-        create_res = client.post("/recipes/", json=recipe_data, headers=headers)
+        create_res = client.post("/recipes/", json=recipe_data, headers=auth_headers)
         recipe_id = create_res.json()["core"]["id"]
 
-        response = client.get(f"/recipes/{recipe_id}", headers=headers)
+        response = client.get(f"/recipes/{recipe_id}", headers=auth_headers)
         assert response.status_code == 200
         data = response.json()
 
@@ -382,68 +426,32 @@ class TestRecipeUnitConversionAPI:
         # Check that unit_system is included and derived correctly
         assert data["unit_system"] == "imperial"
 
-    def test_read_recipe_unit_system_metric(self, client: TestClient, db):
+    def test_read_recipe_unit_system_metric(
+        self, client: TestClient, db, auth_headers, metric_recipe_id
+    ):
         """Test that unit_system is correctly derived as metric."""
-        headers = get_auth_headers(client, db)
-
-        recipe_data = {
-            "core": {"name": "Metric Recipe For System"},
-            "times": {},
-            "nutrition": {},
-            "components": [
-                {
-                    "name": "Main",
-                    "ingredients": [
-                        {"ingredient_name": "Water", "quantity": 500, "unit": "ml"},
-                        {"ingredient_name": "Sugar", "quantity": 100, "unit": "g"},
-                    ],
-                }
-            ],
-            "instructions": [],
-        }
-        create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-        recipe_id = create_res.json()["core"]["id"]
-
-        response = client.get(f"/recipes/{recipe_id}", headers=headers)
+        response = client.get(f"/recipes/{metric_recipe_id}", headers=auth_headers)
         assert response.status_code == 200
         data = response.json()
 
         # Recipe uses metric units, so unit_system should be metric
         assert data["unit_system"] == "metric"
 
-    def test_read_recipe_unit_system_imperial(self, client: TestClient, db):
+    def test_read_recipe_unit_system_imperial(
+        self, client: TestClient, db, auth_headers, imperial_recipe_id
+    ):
         """Test that unit_system is correctly derived as imperial."""
-        headers = get_auth_headers(client, db)
-
-        recipe_data = {
-            "core": {"name": "Imperial Recipe For System"},
-            "times": {},
-            "nutrition": {},
-            "components": [
-                {
-                    "name": "Main",
-                    "ingredients": [
-                        {"ingredient_name": "Flour", "quantity": 2, "unit": "cups"},
-                        {"ingredient_name": "Butter", "quantity": 4, "unit": "oz"},
-                    ],
-                }
-            ],
-            "instructions": [],
-        }
-        create_res = client.post("/recipes/", json=recipe_data, headers=headers)
-        recipe_id = create_res.json()["core"]["id"]
-
-        response = client.get(f"/recipes/{recipe_id}", headers=headers)
+        response = client.get(f"/recipes/{imperial_recipe_id}", headers=auth_headers)
         assert response.status_code == 200
         data = response.json()
 
         # Recipe uses imperial units, so unit_system should be imperial
         assert data["unit_system"] == "imperial"
 
-    def test_read_recipe_scale_and_units_combined(self, client: TestClient, db):
+    def test_read_recipe_scale_and_units_combined(
+        self, client: TestClient, db, auth_headers
+    ):
         """Test combining scale and unit conversion parameters."""
-        headers = get_auth_headers(client, db)
-
         recipe_data = {
             "core": {"name": "Scale and Convert Recipe", "yield_amount": 4},
             "times": {},
@@ -458,12 +466,12 @@ class TestRecipeUnitConversionAPI:
             ],
             "instructions": [],
         }
-        create_res = client.post("/recipes/", json=recipe_data, headers=headers)
+        create_res = client.post("/recipes/", json=recipe_data, headers=auth_headers)
         recipe_id = create_res.json()["core"]["id"]
 
         # Scale by 2 and convert to metric
         response = client.get(
-            f"/recipes/{recipe_id}?scale=2&units=metric", headers=headers
+            f"/recipes/{recipe_id}?scale=2&units=metric", headers=auth_headers
         )
         assert response.status_code == 200
         data = response.json()
@@ -476,10 +484,8 @@ class TestRecipeUnitConversionAPI:
         # Yield should also be scaled
         assert data["core"]["yield_amount"] == 8
 
-    def test_invalid_units_parameter(self, client: TestClient, db):
+    def test_invalid_units_parameter(self, client: TestClient, db, auth_headers):
         """Test that invalid units parameter returns 422."""
-        headers = get_auth_headers(client, db)
-
         recipe_data = {
             "core": {"name": "Invalid Units Recipe"},
             "times": {},
@@ -487,16 +493,18 @@ class TestRecipeUnitConversionAPI:
             "components": [],
             "instructions": [],
         }
-        create_res = client.post("/recipes/", json=recipe_data, headers=headers)
+        create_res = client.post("/recipes/", json=recipe_data, headers=auth_headers)
         recipe_id = create_res.json()["core"]["id"]
 
-        response = client.get(f"/recipes/{recipe_id}?units=invalid", headers=headers)
+        response = client.get(
+            f"/recipes/{recipe_id}?units=invalid", headers=auth_headers
+        )
         assert response.status_code == 422
 
-    def test_unknown_units_preserved_in_conversion(self, client: TestClient, db):
+    def test_unknown_units_preserved_in_conversion(
+        self, client: TestClient, db, auth_headers
+    ):
         """Test that non-convertible units are preserved."""
-        headers = get_auth_headers(client, db)
-
         recipe_data = {
             "core": {"name": "Mixed Units Recipe"},
             "times": {},
@@ -512,10 +520,12 @@ class TestRecipeUnitConversionAPI:
             ],
             "instructions": [],
         }
-        create_res = client.post("/recipes/", json=recipe_data, headers=headers)
+        create_res = client.post("/recipes/", json=recipe_data, headers=auth_headers)
         recipe_id = create_res.json()["core"]["id"]
 
-        response = client.get(f"/recipes/{recipe_id}?units=metric", headers=headers)
+        response = client.get(
+            f"/recipes/{recipe_id}?units=metric", headers=auth_headers
+        )
         assert response.status_code == 200
         data = response.json()
 
@@ -529,10 +539,8 @@ class TestRecipeUnitConversionAPI:
         assert butter["unit"] == "ml"
         assert abs(butter["quantity"] - 14.79) < 0.1
 
-    def test_multiple_components_conversion(self, client: TestClient, db):
+    def test_multiple_components_conversion(self, client: TestClient, db, auth_headers):
         """Test unit conversion across multiple recipe components."""
-        headers = get_auth_headers(client, db)
-
         recipe_data = {
             "core": {"name": "Multi-Component Recipe"},
             "times": {},
@@ -553,10 +561,12 @@ class TestRecipeUnitConversionAPI:
             ],
             "instructions": [],
         }
-        create_res = client.post("/recipes/", json=recipe_data, headers=headers)
+        create_res = client.post("/recipes/", json=recipe_data, headers=auth_headers)
         recipe_id = create_res.json()["core"]["id"]
 
-        response = client.get(f"/recipes/{recipe_id}?units=metric", headers=headers)
+        response = client.get(
+            f"/recipes/{recipe_id}?units=metric", headers=auth_headers
+        )
         assert response.status_code == 200
         data = response.json()
 
@@ -570,10 +580,8 @@ class TestRecipeUnitConversionAPI:
         assert cheese["unit"] == "g"
         assert abs(cheese["quantity"] - 226.8) < 1
 
-    def test_large_quantity_simplification(self, client: TestClient, db):
+    def test_large_quantity_simplification(self, client: TestClient, db, auth_headers):
         """Test that large quantities are simplified to larger units."""
-        headers = get_auth_headers(client, db)
-
         recipe_data = {
             "core": {"name": "Large Quantity Recipe"},
             "times": {},
@@ -588,10 +596,12 @@ class TestRecipeUnitConversionAPI:
             ],
             "instructions": [],
         }
-        create_res = client.post("/recipes/", json=recipe_data, headers=headers)
+        create_res = client.post("/recipes/", json=recipe_data, headers=auth_headers)
         recipe_id = create_res.json()["core"]["id"]
 
-        response = client.get(f"/recipes/{recipe_id}?units=metric", headers=headers)
+        response = client.get(
+            f"/recipes/{recipe_id}?units=metric", headers=auth_headers
+        )
         assert response.status_code == 200
         data = response.json()
 